@@ -13,7 +13,7 @@ project_root = Path(__file__).parent.parent
 src_path = project_root / "src"
 sys.path.insert(0, str(src_path))
 
-from filter.cli import cli  # noqa: E402
+from filter.__main__ import main  # noqa: E402
 
 if __name__ == "__main__":
-    cli()
+    main()
@@ -1,16 +1,34 @@
 """Filter - An LLM-Powered Kanban Board system."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 __version__ = "0.1.0"
 __author__ = "Seth Lakowske"
 __email__ = "lakowske@gmail.com"
 
-from .actions.build import build
-from .core import calculate_sum, greet
-from .project_cli import project
-from .projects import ProjectManager
-from .stories import StoryManager
-from .story_cli import story
-from .tools import check_github_cli, gh_clone_repo
+if TYPE_CHECKING:
+    from .actions.build import build
+    from .core import calculate_sum, greet
+    from .project_cli import project
+    from .projects import ProjectManager
+    from .stories import StoryManager
+    from .story_cli import story
+    from .tools import check_github_cli, gh_clone_repo
+
+# Public names are imported on first access so that ``import filter`` (and the
+# CLI entry point) does not pull in pydantic, PyYAML and friends up front.
+_LAZY_ATTRS = {
+    "build": ".actions.build",
+    "calculate_sum": ".core",
+    "greet": ".core",
+    "ProjectManager": ".projects",
+    "StoryManager": ".stories",
+    "check_github_cli": ".tools",
+    "gh_clone_repo": ".tools",
+    "project": ".project_cli",
+    "story": ".story_cli",
+}
 
 __all__ = [
     "greet",
@@ -23,3 +41,20 @@ __all__ = [
     "project",
     "story",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import public attributes lazily on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including the lazily imported ones."""
+    return sorted([*globals(), *_LAZY_ATTRS])
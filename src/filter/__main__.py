@@ -0,0 +1,24 @@
+"""Console entry point for filter, also run by ``python -m filter``.
+
+Kept free of Click and the command modules so that ``filter --version`` costs
+little more than interpreter startup.
+"""
+
+import sys
+
+from . import __version__
+
+
+def main() -> None:
+    """Run the filter CLI, answering ``--version`` before anything else is imported."""
+    if sys.argv[1:] in (["--version"], ["-V"]):
+        print(f"filter {__version__}")
+        return
+
+    from .cli import main as cli_main
+
+    cli_main()
+
+
+if __name__ == "__main__":
+    main()
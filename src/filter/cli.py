@@ -1,11 +1,48 @@
+import importlib
+import logging
+from typing import Any, Optional
+
 import click
 
-from .project_cli import project
-from .story_cli import story
-from .tools import check_github_cli, gh_clone_repo
+from . import __version__
+
+_LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - [%(filename)s:%(lineno)d] - %(message)s"
+
+
+class LazyGroup(click.Group):
+    """Click group that imports its ``<name>_cli`` subcommand groups on first use.
+
+    Keeps ``filter --version`` and the top-level commands from paying for the
+    project and story modules (and everything they import) until one of them is
+    actually requested.
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: tuple[str, ...] = (), **kwargs: Any) -> None:
+        """Initialize the group with the names of lazily imported subcommand groups.
 
+        Args:
+            *args: Positional arguments forwarded to ``click.Group``
+            lazy_subcommands: Subcommand names resolved from ``.<name>_cli`` on demand
+            **kwargs: Keyword arguments forwarded to ``click.Group``
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands
 
-@click.group()  # type: ignore[misc]
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        """List eager and lazy subcommands without importing the lazy ones."""
+        return sorted([*super().list_commands(ctx), *self.lazy_subcommands])
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Resolve a subcommand, importing its module if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            module = importlib.import_module(f".{cmd_name}_cli", __package__)
+            command: click.Command = getattr(module, cmd_name)
+            return command
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_subcommands=("project", "story"))  # type: ignore[misc]
+@click.version_option(__version__, "--version", "-V", prog_name="filter", message="%(prog)s %(version)s")
 def cli() -> None:
     """Filter CLI tool."""
 
@@ -15,6 +52,8 @@ def cli() -> None:
 @click.argument("dest", default=".")  # type: ignore[misc]
 def clone(url: str, dest: str) -> None:
     """Clone a repository."""
+    from .tools import gh_clone_repo
+
     is_successful, message = gh_clone_repo(url, dest)
     if is_successful:
         click.echo(message)
@@ -26,6 +65,8 @@ def clone(url: str, dest: str) -> None:
 @cli.command()  # type: ignore[misc]
 def status() -> None:
     """Check the status of the tools filter uses."""
+    from .tools import check_github_cli
+
     is_installed, message = check_github_cli()
     if is_installed:
         click.echo(message)
@@ -34,10 +75,15 @@ def status() -> None:
         return
 
 
-# Register command groups
-cli.add_command(project)
-cli.add_command(story)
+def main() -> None:
+    """Configure logging and dispatch to the command group.
+
+    The console script enters through ``filter.__main__``, which answers
+    ``--version`` before this module is imported.
+    """
+    logging.basicConfig(level=logging.INFO, format=_LOG_FORMAT)
+    cli(prog_name="filter")
 
 
 if __name__ == "__main__":
-    cli()
+    main()
@@ -3,6 +3,7 @@
 This module contains all CLI commands related to project management.
 """
 
+import functools
 from pathlib import Path
 
 import click
@@ -10,6 +11,43 @@ import click
 from .projects import ProjectManager
 
 
+@functools.lru_cache(maxsize=8)
+def _resolve_absolute(path: Path) -> Path:
+    """Resolve an absolute path, caching the result for the life of the process."""
+    return path.resolve()
+
+
+def _resolve(path: str) -> Path:
+    """Resolve a CLI path argument to a canonical absolute path.
+
+    The default ``"."`` is answered with a single ``getcwd()``, which already
+    returns the resolved working directory. Other paths are anchored to the
+    working directory before the cached lookup so a later ``chdir`` cannot
+    return a stale entry.
+
+    Args:
+        path: Path argument as given on the command line
+
+    Returns:
+        Path: Canonical absolute path
+    """
+    if path == ".":
+        return Path.cwd()
+    return _resolve_absolute(Path.cwd() / path)
+
+
+def _manager(path: str) -> ProjectManager:
+    """Build the ProjectManager for a CLI path argument.
+
+    Args:
+        path: Path argument as given on the command line
+
+    Returns:
+        ProjectManager: Manager rooted at the resolved path
+    """
+    return ProjectManager(_resolve(path))
+
+
 @click.group()  # type: ignore[misc]
 def project() -> None:
     """Manage filter projects with kanban workflow directories."""
@@ -24,8 +62,7 @@ def create(path: str) -> None:
     - stories/ for markdown story files
     - kanban/ with planning, in-progress, testing, pr, complete stages
     """
-    project_path = Path(path).resolve()
-    manager = ProjectManager(project_path)
+    manager = _manager(path)
 
     is_successful, message = manager.create_project_structure()
     click.echo(message)
@@ -43,11 +80,10 @@ def delete(path: str, force: bool) -> None:
     Removes the .filter directory and all its contents.
     Use --force to delete projects that contain stories.
     """
-    project_path = Path(path).resolve()
-    manager = ProjectManager(project_path)
+    manager = _manager(path)
 
     if not manager.project_exists():
-        click.echo(f"No filter project found at {project_path}")
+        click.echo(f"No filter project found at {manager.project_path}")
         return
 
     # Show project info before deletion
@@ -69,12 +105,11 @@ def delete(path: str, force: bool) -> None:
 @click.argument("path", default=".")  # type: ignore[misc]
 def info(path: str) -> None:
     """Show information about a filter project."""
-    project_path = Path(path).resolve()
-    manager = ProjectManager(project_path)
+    manager = _manager(path)
 
     project_info = manager.get_project_info()
     if not project_info:
-        click.echo(f"No filter project found at {project_path}")
+        click.echo(f"No filter project found at {manager.project_path}")
         return
 
     click.echo(f"Filter Project: {project_info['project_path']}")
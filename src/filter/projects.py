@@ -1,18 +1,108 @@
+import functools
 import logging
+import os
 import re
-import shutil
-from datetime import datetime, timezone
+import stat
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
+# Trailing dashes, underscores and digits stripped from project names before building a prefix
+_PREFIX_CLEAN_RE = re.compile(r"[-_\d]+$")
+
+# Strings that YAML would load back as something other than the same string when left unquoted
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][\w.-]*")
+_YAML_RESERVED_WORDS = frozenset({"y", "n", "yes", "no", "on", "off", "true", "false", "null"})
+
+_README_TEMPLATE = """# Filter Project
+
+This is a Filter-managed project with LLM-powered kanban board functionality.
+
+## Directory Structure
+
+- `stories/` - Contains all story markdown files
+- `kanban/` - Kanban workflow directories with symbolic links to stories
+  - `planning/` - Stories in planning phase
+  - `in-progress/` - Stories currently being worked on
+  - `testing/` - Stories in testing phase
+  - `pr/` - Stories in pull request review
+  - `complete/` - Completed stories
+
+## Usage
+
+Use the `filter` CLI tool to manage stories and workflows:
+
+```bash
+# Create a new story
+filter story create "Story title"
+
+# Move story to different stage
+filter story move <story-id> <stage>
+
+# List stories by stage
+filter story list --stage in-progress
+```
+
+For more information, see the Filter documentation.
+"""
+_README_BYTES = _README_TEMPLATE.encode("utf-8")
+
+
+def _yaml_str(value: str) -> str:
+    """Render a string as a YAML scalar that loads back unchanged.
+
+    Args:
+        value: String to render
+
+    Returns:
+        str: The plain string when YAML reads it literally, otherwise a single-quoted scalar
+    """
+    if _PLAIN_SCALAR_RE.fullmatch(value) and value.lower() not in _YAML_RESERVED_WORDS:
+        return value
+    return "'" + value.replace("'", "''") + "'"
+
+
+def _write_small(path: str, data: bytes) -> None:
+    """Write a small payload to a file with raw os calls, replacing any existing content.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _count_entries(path: str) -> int:
+    """Count the entries of a directory in a single scandir pass.
+
+    Args:
+        path: Directory to count
+
+    Returns:
+        int: Number of entries, or 0 if the directory (or one of its parents) does not exist
+    """
+    try:
+        it = os.scandir(path)
+    except (FileNotFoundError, NotADirectoryError):
+        return 0
+    with it:
+        return sum(1 for _ in it)
+
 
 class ProjectManager:
     """Manages filter project structure and kanban workflow directories."""
 
+    _KANBAN_STAGES: tuple[str, ...] = ("planning", "in-progress", "testing", "pr", "complete")
+    # The kanban_stages block of config.yml, rendered once for every project
+    _KANBAN_STAGES_YAML = "".join(f"- {stage}\n" for stage in _KANBAN_STAGES)
+
     def __init__(self, project_path: Path) -> None:
         """Initialize project manager with the target project directory.
 
@@ -24,7 +114,14 @@ class ProjectManager:
         self.config_path = self.filter_dir / "config.yml"
         self.kanban_dir = self.filter_dir / "kanban"
 
-        logger.info(f"Initialized ProjectManager - project_path: {self.project_path}")
+        # String forms for the os-level calls on the hot paths, built once per manager
+        self._filter_dir_str = str(self.filter_dir)
+        self._kanban_dir_str = str(self.kanban_dir)
+        self._stories_dir_str = os.path.join(self._filter_dir_str, "stories")
+        self._config_path_str = str(self.config_path)
+
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Initialized ProjectManager - project_path: %s", self.project_path)
 
     def create_project_structure(self) -> tuple[bool, str]:
         """Create the .filter directory structure with kanban workflow directories.
@@ -34,49 +131,45 @@ class ProjectManager:
         """
         logger.info("Creating filter project structure")
 
-        if self.filter_dir.exists():
-            logger.warning(f"Filter directory already exists - path: {self.filter_dir}")
-            return False, f"Filter project already exists at {self.filter_dir}"
-
         try:
-            # Create main .filter directory
-            self.filter_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created filter directory - path: {self.filter_dir}")
-
-            # Create kanban workflow directories
-            kanban_stages = ["planning", "in-progress", "testing", "pr", "complete"]
-
-            # Create kanban parent directory
-            self.kanban_dir.mkdir(parents=True, exist_ok=True)
-            logger.info(f"Created kanban directory - path: {self.kanban_dir}")
+            # Create main .filter directory. No exists() precheck: mkdir reports an existing one itself.
+            try:
+                self.filter_dir.mkdir(parents=True)
+            except FileExistsError:
+                logger.warning("Filter directory already exists - path: %s", self.filter_dir)
+                return False, f"Filter project already exists at {self.filter_dir}"
+            logger.info("Created filter directory - path: %s", self.filter_dir)
+
+            # Create kanban parent directory. The .filter directory was created above, so none of its
+            # children exist yet and plain os.mkdir on the cached strings skips pathlib's path building.
+            os.mkdir(self._kanban_dir_str)
+            logger.info("Created kanban directory - path: %s", self._kanban_dir_str)
 
             # Create stories directory
-            stories_dir = self.filter_dir / "stories"
-            stories_dir.mkdir(exist_ok=True)
-            logger.info(f"Created stories directory - path: {stories_dir}")
+            os.mkdir(self._stories_dir_str)
+            logger.info("Created stories directory - path: %s", self._stories_dir_str)
 
             # Create each kanban stage directory
-            for stage in kanban_stages:
-                stage_dir = self.kanban_dir / stage
-                stage_dir.mkdir(exist_ok=True)
-                logger.debug(f"Created kanban stage directory - stage: {stage}, path: {stage_dir}")
+            for stage in self._KANBAN_STAGES:
+                stage_dir = os.path.join(self._kanban_dir_str, stage)
+                os.mkdir(stage_dir)
+                logger.debug("Created kanban stage directory - stage: %s, path: %s", stage, stage_dir)
 
             # Create initial config.yml
             config_content = self._generate_config_content()
-            self.config_path.write_text(config_content, encoding="utf-8")
-            logger.info(f"Created project config - path: {self.config_path}")
+            _write_small(self._config_path_str, config_content.encode("utf-8"))
+            logger.info("Created project config - path: %s", self.config_path)
 
             # Create initial README
-            readme_content = self._generate_readme_content()
-            readme_path = self.filter_dir / "README.md"
-            readme_path.write_text(readme_content)
-            logger.info(f"Created project README - path: {readme_path}")
+            readme_path = os.path.join(self._filter_dir_str, "README.md")
+            _write_small(readme_path, _README_BYTES)
+            logger.info("Created project README - path: %s", readme_path)
 
             logger.info("Successfully created complete filter project structure")
             return True, f"Filter project created successfully at {self.filter_dir}"
 
         except OSError as e:
-            logger.error(f"Failed to create project structure - error: {e}")
+            logger.error("Failed to create project structure - error: %s", e)
             return False, f"Failed to create project structure: {e}"
 
     def delete_project_structure(self, force: bool = False) -> tuple[bool, str]:
@@ -88,27 +181,28 @@ class ProjectManager:
         Returns:
             tuple[bool, str]: Success status and descriptive message
         """
-        logger.info(f"Deleting filter project structure - force: {force}")
-
-        if not self.filter_dir.exists():
-            logger.warning(f"Filter directory does not exist - path: {self.filter_dir}")
-            return False, f"No filter project found at {self.filter_dir}"
+        logger.info("Deleting filter project structure - force: %s", force)
 
+        # No separate existence check: a missing .filter surfaces as FileNotFoundError from rmtree
         if not force:
             # Check if there are active stories
-            stories_dir = self.filter_dir / "stories"
-            if stories_dir.exists() and any(stories_dir.iterdir()):
-                story_count = len(list(stories_dir.iterdir()))
-                logger.warning(f"Active stories found - count: {story_count}")
+            story_count = _count_entries(self._stories_dir_str)
+            if story_count > 0:
+                logger.warning("Active stories found - count: %s", story_count)
                 return False, f"Project contains {story_count} stories. Use --force to delete anyway."
 
+        import shutil
+
         try:
-            shutil.rmtree(self.filter_dir)
-            logger.info(f"Successfully deleted filter project - path: {self.filter_dir}")
+            shutil.rmtree(self._filter_dir_str)
+            logger.info("Successfully deleted filter project - path: %s", self.filter_dir)
             return True, f"Filter project deleted successfully from {self.project_path}"
 
         except OSError as e:
-            logger.error(f"Failed to delete project structure - error: {e}")
+            if isinstance(e, FileNotFoundError) and e.filename == self._filter_dir_str:
+                logger.warning("Filter directory does not exist - path: %s", self.filter_dir)
+                return False, f"No filter project found at {self.filter_dir}"
+            logger.error("Failed to delete project structure - error: %s", e)
             return False, f"Failed to delete project structure: {e}"
 
     def project_exists(self) -> bool:
@@ -117,8 +211,12 @@ class ProjectManager:
         Returns:
             bool: True if .filter directory exists and is valid
         """
-        exists = self.filter_dir.exists() and self.filter_dir.is_dir()
-        logger.debug(f"Project exists check - path: {self.filter_dir}, exists: {exists}")
+        try:
+            exists = stat.S_ISDIR(os.stat(self._filter_dir_str).st_mode)
+        except OSError:
+            exists = False
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Project exists check - path: %s, exists: %s", self.filter_dir, exists)
         return exists
 
     def get_project_info(self) -> Optional[dict[str, Any]]:
@@ -127,36 +225,46 @@ class ProjectManager:
         Returns:
             dict with project information or None if no project exists
         """
-        if not self.project_exists():
+        # One stat both validates the project and supplies its creation time
+        try:
+            filter_stat = os.stat(self._filter_dir_str)
+        except OSError:
+            filter_stat = None
+        if filter_stat is None or not stat.S_ISDIR(filter_stat.st_mode):
             return None
 
         try:
-            stories_dir = self.filter_dir / "stories"
-            story_count = len(list(stories_dir.iterdir())) if stories_dir.exists() else 0
+            story_count = _count_entries(self._stories_dir_str)
 
             # Count stories in each kanban stage
             stage_counts = {}
-            if self.kanban_dir.exists():
-                for stage_dir in self.kanban_dir.iterdir():
-                    if stage_dir.is_dir():
-                        stage_counts[stage_dir.name] = len(list(stage_dir.iterdir()))
+            try:
+                with os.scandir(self._kanban_dir_str) as stages:
+                    for stage_entry in stages:
+                        if stage_entry.is_dir(follow_symlinks=False):
+                            stage_counts[stage_entry.name] = _count_entries(stage_entry.path)
+            except FileNotFoundError:
+                pass
 
             project_info = {
                 "project_path": str(self.project_path),
                 "filter_path": str(self.filter_dir),
                 "total_stories": story_count,
                 "stage_counts": stage_counts,
-                "created_at": self.filter_dir.stat().st_ctime,
+                "created_at": filter_stat.st_ctime,
             }
 
-            logger.debug(f"Retrieved project info - info: {project_info}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Retrieved project info - info: %r", project_info)
             return project_info
 
         except OSError as e:
-            logger.error(f"Failed to get project info - error: {e}")
+            logger.error("Failed to get project info - error: %s", e)
             return None
 
-    def _generate_prefix(self, project_name: str) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _generate_prefix(project_name: str) -> str:
         """Generate a story prefix from project name.
 
         Args:
@@ -166,12 +274,13 @@ class ProjectManager:
             str: Generated prefix (e.g., "FILTE" for "filter")
         """
         # Remove common suffixes and clean the name
-        clean_name = re.sub(r"[-_\d]+$", "", project_name.lower())
+        clean_name = _PREFIX_CLEAN_RE.sub("", project_name.lower())
 
         # Take first 5 characters, or pad if shorter
         prefix = clean_name[:5].upper() if len(clean_name) >= 5 else clean_name.upper().ljust(5, "X")
 
-        logger.debug(f"Generated prefix - project_name: {project_name}, prefix: {prefix}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Generated prefix - project_name: %s, prefix: %s", project_name, prefix)
         return prefix
 
     def _generate_config_content(self) -> str:
@@ -180,15 +289,19 @@ class ProjectManager:
         Returns:
             str: YAML configuration content
         """
-        config = {
-            "project_name": self.project_path.name,
-            "prefix": self._generate_prefix(self.project_path.name),
-            "last_story_number": 0,
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "kanban_stages": ["planning", "in-progress", "testing", "pr", "complete"],
-        }
+        from datetime import datetime, timezone
 
-        return str(yaml.safe_dump(config, default_flow_style=False, sort_keys=False))
+        project_name = self.project_path.name
+        created_at = datetime.now(timezone.utc).isoformat()
+
+        # Fixed layout matching what yaml.safe_dump produced, without loading PyYAML
+        return (
+            f"project_name: {_yaml_str(project_name)}\n"
+            f"prefix: {_yaml_str(self._generate_prefix(project_name))}\n"
+            "last_story_number: 0\n"
+            f"created_at: {_yaml_str(created_at)}\n"
+            f"kanban_stages:\n{self._KANBAN_STAGES_YAML}"
+        )
 
     def _generate_readme_content(self) -> str:
         """Generate README content for the filter project.
@@ -196,34 +309,4 @@ class ProjectManager:
         Returns:
             str: README content in markdown format
         """
-        return """# Filter Project
-
-This is a Filter-managed project with LLM-powered kanban board functionality.
-
-## Directory Structure
-
-- `stories/` - Contains all story markdown files
-- `kanban/` - Kanban workflow directories with symbolic links to stories
-  - `planning/` - Stories in planning phase
-  - `in-progress/` - Stories currently being worked on
-  - `testing/` - Stories in testing phase
-  - `pr/` - Stories in pull request review
-  - `complete/` - Completed stories
-
-## Usage
-
-Use the `filter` CLI tool to manage stories and workflows:
-
-```bash
-# Create a new story
-filter story create "Story title"
-
-# Move story to different stage
-filter story move <story-id> <stage>
-
-# List stories by stage
-filter story list --stage in-progress
-```
-
-For more information, see the Filter documentation.
-"""
+        return _README_TEMPLATE
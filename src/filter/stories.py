@@ -1,13 +1,134 @@
 import logging
+import os
 import re
+import stat
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
 logger = logging.getLogger(__name__)
 
+# Keys every loaded config is guaranteed to have, in the order _default_config builds them
+_CONFIG_KEYS = ("project_name", "prefix", "last_story_number", "created_at", "kanban_stages")
+
+# Trailing dashes, underscores and digits stripped from project names before building a prefix
+_PREFIX_CLEAN_RE = re.compile(r"[-_\d]+$")
+
+# Bytes of a story read up front when looking for its title heading
+_TITLE_SCAN_BYTES = 4096
+
+# Age after which a temporary file left by _write_atomic is treated as abandoned by a crashed writer
+_STALE_TMP_SECONDS = 3600
+
+
+def _find_heading(data: bytes) -> int:
+    """Find the first line of a story that starts with a "# " heading.
+
+    Args:
+        data: Leading bytes of the story file
+
+    Returns:
+        int: Offset of the heading line, or -1 if there is none
+    """
+    if data.startswith(b"# "):
+        return 0
+    index = data.find(b"\n# ")
+    return index + 1 if index >= 0 else -1
+
+
+def _rename_keeps_metadata(target: Path, target_stat: os.stat_result) -> bool:
+    """Check whether a file we create could replace target without losing its owner or ACLs.
+
+    Args:
+        target: Existing file that would be replaced
+        target_stat: Result of stat on target
+
+    Returns:
+        bool: True if renaming a new file over target keeps its ownership and permissions
+    """
+    if target_stat.st_uid != os.geteuid():
+        return False
+    if target_stat.st_gid != os.getegid() and target_stat.st_gid not in os.getgroups():
+        return False
+    try:
+        attrs = os.listxattr(target)
+    except (AttributeError, OSError):  # No xattr support on this platform or filesystem
+        return True
+    return "system.posix_acl_access" not in attrs
+
+
+def _remove_stale_temporaries(target: Path) -> None:
+    """Remove temporary files a crashed _write_atomic left next to target.
+
+    Only files older than _STALE_TMP_SECONDS are removed, so a concurrent writer's
+    temporary file is never taken away from it.
+
+    Args:
+        target: File whose leftover temporaries to remove
+    """
+    prefix = f".{target.name}."
+    cutoff = time.time() - _STALE_TMP_SECONDS
+    with os.scandir(target.parent) as entries:
+        for entry in entries:
+            if not (entry.name.startswith(prefix) and entry.name.endswith(".tmp")):
+                continue
+            try:
+                if entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                    os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write a file by renaming a fully written temporary file over it.
+
+    Readers see either the old content or the new content, never a partial write.
+    A symlinked path is written through to its target. An existing file keeps its
+    mode and group, and one whose owner or ACLs a rename would lose is rewritten in
+    place instead.
+
+    Args:
+        path: Destination file path
+        data: Bytes to write
+    """
+    target = path.resolve()
+    try:
+        target_stat: Optional[os.stat_result] = target.stat()
+    except FileNotFoundError:
+        target_stat = None
+    if target_stat is not None and not _rename_keeps_metadata(target, target_stat):
+        target.write_bytes(data)
+        return
+
+    # A new file is created 0666 so the kernel applies the umask, as a plain open would
+    mode = 0o666 if target_stat is None else 0o600
+    while True:
+        tmp_path = target.with_name(f".{target.name}.{os.urandom(4).hex()}.tmp")
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+            break
+        except FileExistsError:
+            continue
+
+    try:
+        try:
+            if target_stat is not None:
+                os.fchmod(fd, stat.S_IMODE(target_stat.st_mode))
+                if os.fstat(fd).st_gid != target_stat.st_gid:
+                    os.fchown(fd, -1, target_stat.st_gid)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view) :]
+        finally:
+            os.close(fd)
+        tmp_path.replace(target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+    _remove_stale_temporaries(target)
+
 
 class StoryManager:
     """Manages story creation, deletion, and workflow operations."""
@@ -24,32 +145,71 @@ class StoryManager:
         self.stories_dir = self.filter_dir / "stories"
         self.kanban_dir = self.filter_dir / "kanban"
 
-        logger.info(f"Initialized StoryManager - project_path: {self.project_path}")
+        # Parsed config.yml and the (st_mtime_ns, st_size) of the file it was read from
+        self._config_cache: Optional[dict[str, Any]] = None
+        self._config_stamp: Optional[tuple[int, int]] = None
+        # Set form of the current config's kanban_stages, for membership checks
+        self._stage_set: frozenset[str] = frozenset()
+        # String paths of the kanban stage directories, filled in as stages are used
+        self._kanban_dir_str = str(self.kanban_dir)
+        self._stage_dirs: dict[str, str] = {}
+        # Set once the .filter structure has been verified; cleared when a filesystem operation fails
+        self._structure_ok = False
+
+        logger.info("Initialized StoryManager - project_path: %s", self.project_path)
+
+    def _stage_dir(self, stage: str) -> str:
+        """Get the directory path of a kanban stage as a string.
+
+        Args:
+            stage: Kanban stage name
+
+        Returns:
+            str: Path of the stage directory
+        """
+        stage_dir = self._stage_dirs.get(stage)
+        if stage_dir is None:
+            stage_dir = self._stage_dirs[stage] = os.path.join(self._kanban_dir_str, stage)
+        return stage_dir
 
     def _ensure_filter_structure(self) -> tuple[bool, str]:
         """Ensure the .filter directory structure exists.
 
+        A successful check is remembered, so later calls on the same manager
+        skip the filesystem until an operation fails.
+
         Returns:
             tuple[bool, str]: Success status and message
         """
-        if not self.filter_dir.exists():
+        if self._structure_ok:
+            return True, "Filter structure verified"
+
+        # One listing of .filter both proves it exists and shows which children it has
+        try:
+            with os.scandir(self.filter_dir) as entries:
+                names = {entry.name for entry in entries}
+        except (FileNotFoundError, NotADirectoryError):
             return False, f"No filter project found at {self.project_path}. Run 'filter project create' first."
+        except OSError as e:
+            logger.error("Failed to read filter directory - error: %s", e)
+            return False, f"Cannot read filter project at {self.filter_dir}: {e}"
 
         # Verify essential directories exist
         required_dirs = [self.stories_dir, self.kanban_dir]
         for dir_path in required_dirs:
-            if not dir_path.exists():
+            if dir_path.name not in names:
                 return False, f"Missing required directory: {dir_path}. Project structure may be corrupted."
 
+        self._structure_ok = True
         return True, "Filter structure verified"
 
-    def _load_config(self) -> dict[str, Any]:
-        """Load project configuration from config.yml.
+    def _default_config(self) -> dict[str, Any]:
+        """Build the default project configuration.
 
         Returns:
-            dict: Project configuration
+            dict: Default configuration for this project
         """
-        default_config = {
+        return {
             "project_name": self.project_path.name,
             "prefix": self._generate_prefix(self.project_path.name),
             "last_story_number": 0,
@@ -57,26 +217,73 @@ class StoryManager:
             "kanban_stages": ["planning", "in-progress", "testing", "pr", "complete"],
         }
 
-        if not self.config_path.exists():
-            logger.info(f"Creating new config file - path: {self.config_path}")
+    def _load_config(self) -> dict[str, Any]:
+        """Load project configuration from config.yml.
+
+        The parsed config is cached and reused while the file's modification
+        time and size are unchanged. Defaults are only built when the file is
+        missing, unreadable or lacks a key.
+
+        Returns:
+            dict: Project configuration (a shallow copy callers may modify)
+        """
+        try:
+            config_stat = self.config_path.stat()
+        except FileNotFoundError:
+            logger.info("Creating new config file - path: %s", self.config_path)
+            default_config = self._default_config()
             self._save_config(default_config)
             return default_config
 
-        try:
-            with self.config_path.open(encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
-                logger.debug(f"Loaded config - config: {config}")
+        stamp = (config_stat.st_mtime_ns, config_stat.st_size)
+        if self._config_cache is not None and stamp == self._config_stamp:
+            return dict(self._config_cache)
 
-                # Merge with defaults for any missing keys
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
-                        logger.debug(f"Added missing config key - key: {key}, value: {value}")
+        # PyYAML is only imported when config.yml actually has to be parsed
+        import yaml
 
-                return config
+        try:
+            from yaml import CSafeLoader as SafeLoader
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeLoader  # type: ignore[assignment]
+
+        try:
+            # Hand libyaml the raw bytes; it decodes UTF-8 itself
+            with self.config_path.open("rb") as f:
+                config = yaml.load(f.read(), Loader=SafeLoader) or {}
         except (yaml.YAMLError, OSError) as e:
-            logger.error(f"Failed to load config, using defaults - error: {e}")
+            logger.error("Failed to load config, using defaults - error: %s", e)
+            default_config = self._default_config()
+            self._stage_set = frozenset(default_config["kanban_stages"])
             return default_config
+        logger.debug("Loaded config - config: %s", config)
+
+        self._merge_defaults(config)
+        self._cache_config(config, stamp)
+        return dict(config)
+
+    def _merge_defaults(self, config: dict[str, Any]) -> None:
+        """Fill in default values for any keys missing from a config.
+
+        Args:
+            config: Config to complete in place
+        """
+        if not all(key in config for key in _CONFIG_KEYS):
+            for key, value in self._default_config().items():
+                if key not in config:
+                    config[key] = value
+                    logger.debug("Added missing config key - key: %s, value: %s", key, value)
+
+    def _cache_config(self, config: dict[str, Any], stamp: tuple[int, int]) -> None:
+        """Remember a complete config and the config.yml stamp it corresponds to.
+
+        Args:
+            config: Config containing every key in _CONFIG_KEYS
+            stamp: (st_mtime_ns, st_size) of config.yml holding this config
+        """
+        self._config_cache = config
+        self._config_stamp = stamp
+        self._stage_set = frozenset(config["kanban_stages"])
 
     def _save_config(self, config: dict[str, Any]) -> None:
         """Save project configuration to config.yml.
@@ -84,14 +291,30 @@ class StoryManager:
         Args:
             config: Configuration dictionary to save
         """
+        import yaml
+
+        try:
+            from yaml import CSafeDumper as SafeDumper
+        except ImportError:  # PyYAML built without libyaml
+            from yaml import SafeDumper  # type: ignore[assignment]
+
         try:
-            with self.config_path.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False)
-                logger.debug(f"Saved config - path: {self.config_path}")
+            # Render in one piece and rename it into place, so an interrupted save never leaves a torn file
+            data = yaml.dump(config, Dumper=SafeDumper, encoding="utf-8", default_flow_style=False, sort_keys=False)
+            _write_atomic(self.config_path, data)
+            logger.debug("Saved config - path: %s", self.config_path)
         except (yaml.YAMLError, OSError) as e:
-            logger.error(f"Failed to save config - error: {e}")
+            logger.error("Failed to save config - error: %s", e)
+            self._config_cache = self._config_stamp = None
             raise
 
+        # Remember what was written so the next load skips re-parsing it, completed with
+        # defaults just as _load_config would complete it
+        config_stat = self.config_path.stat()
+        cached = dict(config)
+        self._merge_defaults(cached)
+        self._cache_config(cached, (config_stat.st_mtime_ns, config_stat.st_size))
+
     def _generate_prefix(self, project_name: str) -> str:
         """Generate a story prefix from project name.
 
@@ -102,21 +325,25 @@ class StoryManager:
             str: Generated prefix (e.g., "FILTE" for "filter")
         """
         # Remove common suffixes and clean the name
-        clean_name = re.sub(r"[-_\d]+$", "", project_name.lower())
+        clean_name = _PREFIX_CLEAN_RE.sub("", project_name.lower())
 
         # Take first 5 characters, or pad if shorter
         prefix = clean_name[:5].upper() if len(clean_name) >= 5 else clean_name.upper().ljust(5, "X")
 
-        logger.debug(f"Generated prefix - project_name: {project_name}, prefix: {prefix}")
+        logger.debug("Generated prefix - project_name: %s, prefix: %s", project_name, prefix)
         return prefix
 
-    def _get_next_story_number(self) -> tuple[int, str]:
+    def _get_next_story_number(self, config: Optional[dict[str, Any]] = None) -> tuple[int, str]:
         """Get the next story number and update configuration.
 
+        Args:
+            config: Already loaded configuration to update, loaded from disk if omitted
+
         Returns:
             tuple[int, str]: Next story number and full story ID
         """
-        config = self._load_config()
+        if config is None:
+            config = self._load_config()
         next_number = config["last_story_number"] + 1
         story_id = f"{config['prefix']}-{next_number}"
 
@@ -124,7 +351,7 @@ class StoryManager:
         config["last_story_number"] = next_number
         self._save_config(config)
 
-        logger.info(f"Generated next story ID - story_id: {story_id}")
+        logger.info("Generated next story ID - story_id: %s", story_id)
         return next_number, story_id
 
     def create_story(self, title: str, description: str = "", stage: str = "planning") -> tuple[bool, str]:
@@ -138,7 +365,7 @@ class StoryManager:
         Returns:
             tuple[bool, str]: Success status and message with story ID
         """
-        logger.info(f"Creating new story - title: {title}, stage: {stage}")
+        logger.info("Creating new story - title: %s, stage: %s", title, stage)
 
         # Ensure filter structure exists
         is_valid, message = self._ensure_filter_structure()
@@ -147,29 +374,29 @@ class StoryManager:
 
         # Validate stage
         config = self._load_config()
-        if stage not in config["kanban_stages"]:
+        if stage not in self._stage_set:
             return False, f"Invalid stage '{stage}'. Valid stages: {', '.join(config['kanban_stages'])}"
 
         try:
             # Generate story ID and create story file
-            _, story_id = self._get_next_story_number()
+            _, story_id = self._get_next_story_number(config)
             story_file = self.stories_dir / f"{story_id}.md"
 
             # Create story content
             story_content = self._generate_story_content(story_id, title, description)
             story_file.write_text(story_content, encoding="utf-8")
-            logger.info(f"Created story file - path: {story_file}")
+            logger.info("Created story file - path: %s", story_file)
 
             # Create symlink in kanban stage
-            stage_dir = self.kanban_dir / stage
-            stage_link = stage_dir / f"{story_id}.md"
-            stage_link.symlink_to(f"../../stories/{story_id}.md")
-            logger.info(f"Created kanban symlink - stage: {stage}, link: {stage_link}")
+            stage_link = os.path.join(self._stage_dir(stage), f"{story_id}.md")
+            os.symlink(f"../../stories/{story_id}.md", stage_link)
+            logger.info("Created kanban symlink - stage: %s, link: %s", stage, stage_link)
 
             return True, f"Created story {story_id}: {title}"
 
         except (OSError, FileExistsError) as e:
-            logger.error(f"Failed to create story - error: {e}")
+            logger.error("Failed to create story - error: %s", e)
+            self._structure_ok = False
             return False, f"Failed to create story: {e}"
 
     def delete_story(self, story_id: str) -> tuple[bool, str]:
@@ -181,7 +408,7 @@ class StoryManager:
         Returns:
             tuple[bool, str]: Success status and message
         """
-        logger.info(f"Deleting story - story_id: {story_id}")
+        logger.info("Deleting story - story_id: %s", story_id)
 
         # Ensure filter structure exists
         is_valid, message = self._ensure_filter_structure()
@@ -198,21 +425,24 @@ class StoryManager:
             config = self._load_config()
             removed_stages = []
             for stage in config["kanban_stages"]:
-                stage_link = self.kanban_dir / stage / f"{story_id}.md"
-                if stage_link.exists():
-                    stage_link.unlink()
-                    removed_stages.append(stage)
-                    logger.debug(f"Removed kanban symlink - stage: {stage}")
+                # Unlink directly: a missing link costs the same one syscall an exists() check would
+                try:
+                    os.unlink(os.path.join(self._stage_dir(stage), f"{story_id}.md"))
+                except FileNotFoundError:
+                    continue
+                removed_stages.append(stage)
+                logger.debug("Removed kanban symlink - stage: %s", stage)
 
             # Remove the story file
             story_file.unlink()
-            logger.info(f"Deleted story file - path: {story_file}")
+            logger.info("Deleted story file - path: %s", story_file)
 
             stage_info = f" (was in {', '.join(removed_stages)})" if removed_stages else ""
             return True, f"Deleted story {story_id}{stage_info}"
 
         except OSError as e:
-            logger.error(f"Failed to delete story - error: {e}")
+            logger.error("Failed to delete story - error: %s", e)
+            self._structure_ok = False
             return False, f"Failed to delete story: {e}"
 
     def list_stories(self, stage: Optional[str] = None) -> list[dict[str, str]]:
@@ -224,12 +454,12 @@ class StoryManager:
         Returns:
             list: List of story dictionaries with id, title, and stage
         """
-        logger.info(f"Listing stories - stage_filter: {stage}")
+        logger.info("Listing stories - stage_filter: %s", stage)
 
         # Ensure filter structure exists
         is_valid, message = self._ensure_filter_structure()
         if not is_valid:
-            logger.warning(f"Cannot list stories - {message}")
+            logger.warning("Cannot list stories - %s", message)
             return []
 
         try:
@@ -240,24 +470,36 @@ class StoryManager:
             stages_to_check = [stage] if stage else config["kanban_stages"]
 
             for check_stage in stages_to_check:
-                stage_dir = self.kanban_dir / check_stage
-                if not stage_dir.exists():
+                try:
+                    entries = os.scandir(self._stage_dir(check_stage))
+                except (FileNotFoundError, NotADirectoryError):
                     continue
 
-                for link_file in stage_dir.glob("*.md"):
-                    if link_file.is_symlink():
-                        story_id = link_file.stem
-                        story_file = self.stories_dir / f"{story_id}.md"
-
-                        if story_file.exists():
-                            title = self._extract_title_from_story(story_file)
-                            stories.append({"id": story_id, "title": title, "stage": check_stage})
-
-            logger.debug(f"Found {len(stories)} stories")
+                # The symlink type comes from the directory listing, and a dangling link shows up
+                # as FileNotFoundError when its story is opened, so no per-story stat is needed
+                with entries:
+                    for entry in entries:
+                        name = entry.name
+                        if not name.endswith(".md") or not entry.is_symlink():
+                            continue
+
+                        story_id = name[:-3]
+                        story_file = self.stories_dir / name
+                        try:
+                            title = self._read_story_title(story_file)
+                        except FileNotFoundError:
+                            continue
+                        except (OSError, UnicodeDecodeError) as e:
+                            logger.warning("Failed to extract title from %s - error: %s", story_file, e)
+                            title = story_id
+                        stories.append({"id": story_id, "title": title, "stage": check_stage})
+
+            logger.debug("Found %s stories", len(stories))
             return stories
 
         except OSError as e:
-            logger.error(f"Failed to list stories - error: {e}")
+            logger.error("Failed to list stories - error: %s", e)
+            self._structure_ok = False
             return []
 
     def _generate_story_content(self, story_id: str, title: str, description: str) -> str:
@@ -303,21 +545,46 @@ class StoryManager:
             str: Extracted title or filename if extraction fails
         """
         try:
-            content = story_file.read_text(encoding="utf-8")
-            # Look for the first heading
-            lines = content.split("\n")
-            for line in lines:
-                if line.startswith("# "):
-                    # Extract title after story ID
-                    title_part = line[2:].strip()
-                    if ": " in title_part:
-                        return title_part.split(": ", 1)[1]
-                    return title_part
-            return story_file.stem
+            return self._read_story_title(story_file)
         except (OSError, UnicodeDecodeError) as e:
-            logger.warning(f"Failed to extract title from {story_file} - error: {e}")
+            logger.warning("Failed to extract title from %s - error: %s", story_file, e)
             return story_file.stem
 
+    def _read_story_title(self, story_file: Path) -> str:
+        """Read the title from a story's first heading.
+
+        Args:
+            story_file: Path to story file
+
+        Returns:
+            str: Extracted title or filename if the story has no heading
+
+        Raises:
+            OSError: If the story cannot be read (FileNotFoundError if it does not exist)
+            UnicodeDecodeError: If the story is not valid UTF-8
+        """
+        with story_file.open("rb") as f:
+            # The heading is almost always the first line, so look in the first block before
+            # reading (and searching) the rest of the file
+            data = f.read(_TITLE_SCAN_BYTES)
+            start = _find_heading(data)
+            if start < 0 and len(data) == _TITLE_SCAN_BYTES:
+                data += f.read()
+                start = _find_heading(data)
+            if start < 0:
+                return story_file.stem
+
+            end = data.find(b"\n", start)
+            if end < 0:
+                data += f.readline()
+                end = len(data)
+
+        # Decode only the heading line, then extract the title after the story ID
+        title_part = data[start + 2 : end].decode("utf-8").strip()
+        if ": " in title_part:
+            return title_part.split(": ", 1)[1]
+        return title_part
+
     def get_project_config(self) -> Optional[dict[str, Any]]:
         """Get the current project configuration.
 
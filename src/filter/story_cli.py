@@ -1,4 +1,5 @@
 import logging
+import os
 from pathlib import Path
 
 import click
@@ -30,7 +31,7 @@ def create(title: str, description: str, stage: str, project_path: str) -> None:
         stage: Initial kanban stage (default: planning)
         project_path: Path to the project directory (default: current directory)
     """
-    logger.info(f"Creating story - title: {title}, stage: {stage}, project_path: {project_path}")
+    logger.info("Creating story - title: %s, stage: %s, project_path: %s", title, stage, project_path)
 
     try:
         story_manager = StoryManager(Path(project_path))
@@ -38,14 +39,14 @@ def create(title: str, description: str, stage: str, project_path: str) -> None:
 
         if is_successful:
             click.echo(f"✓ {message}")
-            logger.info(f"Story creation successful - message: {message}")
+            logger.info("Story creation successful - message: %s", message)
         else:
             click.echo(f"✗ {message}")
-            logger.error(f"Story creation failed - message: {message}")
+            logger.error("Story creation failed - message: %s", message)
             raise click.ClickException(message)
 
     except Exception as e:
-        logger.error(f"Unexpected error during story creation - error: {e}")
+        logger.error("Unexpected error during story creation - error: %s", e)
         error_msg = f"Failed to create story: {e}"
         raise click.ClickException(error_msg) from e
 
@@ -65,7 +66,7 @@ def delete(story_id: str, project_path: str, force: bool) -> None:
         project_path: Path to the project directory (default: current directory)
         force: Force deletion without confirmation
     """
-    logger.info(f"Deleting story - story_id: {story_id}, project_path: {project_path}, force: {force}")
+    logger.info("Deleting story - story_id: %s, project_path: %s, force: %s", story_id, project_path, force)
 
     try:
         story_manager = StoryManager(Path(project_path))
@@ -73,21 +74,21 @@ def delete(story_id: str, project_path: str, force: bool) -> None:
         # Get confirmation unless force is used
         if not force and not click.confirm(f"Are you sure you want to delete story {story_id}?"):
             click.echo("Deletion cancelled.")
-            logger.info(f"Story deletion cancelled by user - story_id: {story_id}")
+            logger.info("Story deletion cancelled by user - story_id: %s", story_id)
             return
 
         is_successful, message = story_manager.delete_story(story_id)
 
         if is_successful:
             click.echo(f"✓ {message}")
-            logger.info(f"Story deletion successful - message: {message}")
+            logger.info("Story deletion successful - message: %s", message)
         else:
             click.echo(f"✗ {message}")
-            logger.error(f"Story deletion failed - message: {message}")
+            logger.error("Story deletion failed - message: %s", message)
             raise click.ClickException(message)
 
     except Exception as e:
-        logger.error(f"Unexpected error during story deletion - error: {e}")
+        logger.error("Unexpected error during story deletion - error: %s", e)
         error_msg = f"Failed to delete story: {e}"
         raise click.ClickException(error_msg) from e
 
@@ -104,7 +105,7 @@ def list(stage: str, project_path: str) -> None:  # noqa: A001
         stage: Optional stage to filter by (planning, in-progress, testing, pr, complete)
         project_path: Path to the project directory (default: current directory)
     """
-    logger.info(f"Listing stories - stage_filter: {stage}, project_path: {project_path}")
+    logger.info("Listing stories - stage_filter: %s, project_path: %s", stage, project_path)
 
     try:
         story_manager = StoryManager(Path(project_path))
@@ -113,7 +114,7 @@ def list(stage: str, project_path: str) -> None:  # noqa: A001
         if not stories:
             stage_msg = f" in stage '{stage}'" if stage else ""
             click.echo(f"No stories found{stage_msg}.")
-            logger.info(f"No stories found - stage_filter: {stage}")
+            logger.info("No stories found - stage_filter: %s", stage)
             return
 
         # Display header
@@ -127,10 +128,10 @@ def list(stage: str, project_path: str) -> None:  # noqa: A001
             click.echo(f"{story['id']}: {story['title']}{stage_display}")
 
         click.echo(f"\nTotal: {len(stories)} stories")
-        logger.info(f"Listed {len(stories)} stories - stage_filter: {stage}")
+        logger.info("Listed %s stories - stage_filter: %s", len(stories), stage)
 
     except Exception as e:
-        logger.error(f"Unexpected error during story listing - error: {e}")
+        logger.error("Unexpected error during story listing - error: %s", e)
         error_msg = f"Failed to list stories: {e}"
         raise click.ClickException(error_msg) from e
 
@@ -149,7 +150,7 @@ def move(story_id: str, target_stage: str, project_path: str) -> None:
         target_stage: Target kanban stage (planning, in-progress, testing, pr, complete)
         project_path: Path to the project directory (default: current directory)
     """
-    logger.info(f"Moving story - story_id: {story_id}, target_stage: {target_stage}, project_path: {project_path}")
+    logger.info("Moving story - story_id: %s, target_stage: %s, project_path: %s", story_id, target_stage, project_path)
 
     try:
         story_manager = StoryManager(Path(project_path))
@@ -160,9 +161,9 @@ def move(story_id: str, target_stage: str, project_path: str) -> None:
             error_msg = "No filter project found. Run 'filter project create' first."
             raise click.ClickException(error_msg)
 
-        if target_stage not in config["kanban_stages"]:
-            valid_stages = ", ".join(config["kanban_stages"])
-            error_msg = f"Invalid stage '{target_stage}'. Valid stages: {valid_stages}"
+        # Loading the config above refreshed the manager's stage set
+        if target_stage not in story_manager._stage_set:
+            error_msg = f"Invalid stage '{target_stage}'. Valid stages: {', '.join(config['kanban_stages'])}"
             raise click.ClickException(error_msg)
 
         # Check if story exists
@@ -171,25 +172,26 @@ def move(story_id: str, target_stage: str, project_path: str) -> None:
             error_msg = f"Story {story_id} not found"
             raise click.ClickException(error_msg)
 
-        # Remove from current stage(s)
+        # Remove from current stage(s), using the manager's cached stage directory strings
+        link_name = f"{story_id}.md"
         removed_from = []
         for stage in config["kanban_stages"]:
-            stage_link = story_manager.kanban_dir / stage / f"{story_id}.md"
-            if stage_link.exists():
-                stage_link.unlink()
-                removed_from.append(stage)
-                logger.debug(f"Removed story from stage - story_id: {story_id}, stage: {stage}")
+            try:
+                os.unlink(os.path.join(story_manager._stage_dir(stage), link_name))
+            except FileNotFoundError:
+                continue
+            removed_from.append(stage)
+            logger.debug("Removed story from stage - story_id: %s, stage: %s", story_id, stage)
 
         # Add to target stage
-        target_dir = story_manager.kanban_dir / target_stage
-        target_link = target_dir / f"{story_id}.md"
-        target_link.symlink_to(f"../../stories/{story_id}.md")
+        target_link = os.path.join(story_manager._stage_dir(target_stage), link_name)
+        os.symlink(f"../../stories/{link_name}", target_link)
 
         from_msg = f" from {', '.join(removed_from)}" if removed_from else ""
         click.echo(f"✓ Moved story {story_id}{from_msg} to {target_stage}")
-        logger.info(f"Story move successful - story_id: {story_id}, target_stage: {target_stage}")
+        logger.info("Story move successful - story_id: %s, target_stage: %s", story_id, target_stage)
 
     except Exception as e:
-        logger.error(f"Unexpected error during story move - error: {e}")
+        logger.error("Unexpected error during story move - error: %s", e)
         error_msg = f"Failed to move story: {e}"
         raise click.ClickException(error_msg) from e
@@ -1,3 +1,4 @@
+import functools
 import logging
 import subprocess
 
@@ -7,13 +8,25 @@ logger = logging.getLogger(__name__)
 def check_github_cli() -> tuple[bool, str]:
     """Check if GitHub CLI (gh) is installed and accessible.
 
+    The result is cached for the life of the process, so ``gh --version`` runs
+    at most once.
+
     Returns:
         tuple[bool, str]: A tuple containing (is_installed, message)
             - is_installed: True if gh is available, False otherwise
             - message: Status message describing the result
     """
     logger.info("Checking GitHub CLI installation status")
+    return _gh_available()
+
+
+@functools.lru_cache(maxsize=1)
+def _gh_available() -> tuple[bool, str]:
+    """Run ``gh --version`` once and cache the outcome.
 
+    Returns:
+        tuple[bool, str]: A tuple containing (is_installed, message), as for check_github_cli
+    """
     try:
         result = subprocess.run(  # noqa: S603
             ["gh", "--version"],  # noqa: S607
@@ -22,10 +35,10 @@ def check_github_cli() -> tuple[bool, str]:
             text=True,
         )
         version_info = result.stdout.strip()
-        logger.info(f"GitHub CLI found - version_info: {version_info}")
+        logger.info("GitHub CLI found - version_info: %s", version_info)
         return True, f"GitHub CLI (gh) is installed: {version_info}"
     except subprocess.CalledProcessError as e:
-        logger.error(f"GitHub CLI check failed - return_code: {e.returncode}, stderr: {e.stderr}")
+        logger.error("GitHub CLI check failed - return_code: %s, stderr: %s", e.returncode, e.stderr)
         return False, f"GitHub CLI command failed: {e.stderr.strip() if e.stderr else 'Unknown error'}"
     except FileNotFoundError:
         logger.warning("GitHub CLI not found in PATH")
@@ -44,7 +57,13 @@ def gh_clone_repo(repo_url: str, dest_dir: str) -> tuple[bool, str]:
             - is_successful: True if cloning was successful, False otherwise
             - message: Status message describing the result
     """
-    logger.info(f"Cloning repository from {repo_url} to {dest_dir}")
+    logger.info("Cloning repository from %s to %s", repo_url, dest_dir)
+
+    # Only reuse an availability check that already ran; don't spawn gh twice to find out
+    if _gh_available.cache_info().currsize:
+        is_installed, message = _gh_available()
+        if not is_installed:
+            return False, message
 
     try:
         result = subprocess.run(  # noqa: S603
@@ -53,10 +72,10 @@ def gh_clone_repo(repo_url: str, dest_dir: str) -> tuple[bool, str]:
             capture_output=True,
             text=True,
         )
-        logger.info(f"Repository cloned successfully - stdout: {result.stdout}")
+        logger.info("Repository cloned successfully - stdout: %s", result.stdout)
         return True, f"Repository cloned successfully to {dest_dir}"
     except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to clone repository - return_code: {e.returncode}, stderr: {e.stderr}")
+        logger.error("Failed to clone repository - return_code: %s, stderr: %s", e.returncode, e.stderr)
         return False, f"Failed to clone repository: {e.stderr.strip() if e.stderr else 'Unknown error'}"
     except FileNotFoundError:
         logger.warning("GitHub CLI not found in PATH")
@@ -1 +1,22 @@
 """Configuration for pytest."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+_TMPFS = Path("/dev/shm")  # noqa: S108
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Keep tmp_path directories on tmpfs when the machine has one.
+
+    Only the temp root moves: pytest still makes its numbered, retained
+    ``pytest-of-<user>/pytest-<N>`` directory per session, so concurrent runs
+    never clean up each other's trees. An explicit ``--basetemp`` or
+    ``PYTEST_DEBUG_TEMPROOT`` is left alone. Under ``pytest -n auto`` the
+    environment is inherited by the xdist workers, and each one gets its own
+    subdirectory of the controller's session directory.
+    """
+    if _TMPFS.is_dir() and os.access(_TMPFS, os.W_OK):
+        os.environ.setdefault("PYTEST_DEBUG_TEMPROOT", str(_TMPFS))
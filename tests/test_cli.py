@@ -1,8 +1,15 @@
 """Tests for the CLI module."""
 
+import sys
+from pathlib import Path
+
+import pytest
 from click.testing import CliRunner
 
+from filter import __version__
+from filter.__main__ import main
 from filter.cli import cli
+from filter.project_cli import _resolve
 
 
 class TestCLI:
@@ -61,3 +68,31 @@ class TestCLI:
 
         assert result.exit_code == 0
         assert "Show information about a filter project" in result.output
+
+    def test_cli_version(self) -> None:
+        """Test --version is handled by the command group."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ["--version"])
+
+        assert result.exit_code == 0
+        assert result.output == f"filter {__version__}\n"
+
+    def test_main_version_fast_path(self, monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the entry point answers -V without dispatching to Click."""
+        monkeypatch.setattr(sys, "argv", ["filter", "-V"])
+
+        main()
+
+        assert capsys.readouterr().out == f"filter {__version__}\n"
+
+    def test_resolve_path_argument(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test CLI path arguments resolve against the current working directory."""
+        (tmp_path / "sub").mkdir()
+        monkeypatch.chdir(tmp_path)
+
+        assert _resolve(".") == tmp_path.resolve()
+        assert _resolve("sub") == (tmp_path / "sub").resolve()
+
+        monkeypatch.chdir(tmp_path / "sub")
+        assert _resolve(".") == (tmp_path / "sub").resolve()
+        assert _resolve("..") == tmp_path.resolve()
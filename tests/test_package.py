@@ -0,0 +1,28 @@
+"""Tests for the lazily imported top-level package exports."""
+
+import pytest
+
+import filter
+from filter.projects import ProjectManager as _ProjectManager
+from filter.stories import StoryManager as _StoryManager
+
+
+def test_from_import_public_managers() -> None:
+    """Test the managers can still be imported from the package itself."""
+    from filter import ProjectManager, StoryManager
+
+    assert ProjectManager is _ProjectManager
+    assert StoryManager is _StoryManager
+
+
+@pytest.mark.parametrize("name", filter.__all__)
+def test_every_public_name_resolves(name: str) -> None:
+    """Test each name in __all__ maps to a module that actually defines it."""
+    assert getattr(filter, name) is not None
+    assert name in dir(filter)
+
+
+def test_unknown_attribute_raises() -> None:
+    """Test an unknown package attribute raises AttributeError."""
+    with pytest.raises(AttributeError, match="module 'filter' has no attribute 'does_not_exist'"):
+        filter.does_not_exist  # noqa: B018
@@ -1,224 +1,206 @@
 """Tests for the projects module."""
 
-import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+import yaml
+
 from filter.projects import ProjectManager
 
+# Never touches disk: for tests of attribute wiring and pure methods only
+_M_PATH = Path("/test/project")
+_M = ProjectManager(_M_PATH)
 
-class TestProjectManager:
-    """Tests for ProjectManager class."""
 
-    def test_init(self) -> None:
-        """Test ProjectManager initialization."""
-        project_path = Path("/test/project")
-        manager = ProjectManager(project_path)
+def _make_stories(dir_: Path, names: list[str]) -> None:
+    """Write a one-line markdown stub for each story file name."""
+    for name in names:
+        (dir_ / name).write_bytes(b"# " + name.encode())
 
-        assert manager.project_path == project_path
-        assert manager.filter_dir == project_path / ".filter"
-        assert manager.kanban_dir == project_path / ".filter" / "kanban"
 
-    def test_create_project_structure_success(self) -> None:
-        """Test successful project structure creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+@pytest.fixture(scope="module")
+def ro_manager(tmp_path_factory: pytest.TempPathFactory) -> ProjectManager:
+    """Manager for an empty directory, shared by the tests that never write to it."""
+    return ProjectManager(tmp_path_factory.mktemp("ro"))
 
-            is_successful, message = manager.create_project_structure()
 
-            assert is_successful is True
-            assert "Filter project created successfully" in message
+@pytest.fixture
+def fresh_manager(tmp_path: Path) -> ProjectManager:
+    """Manager for an empty directory of the test's own."""
+    return ProjectManager(tmp_path)
 
-            # Verify directory structure
-            assert manager.filter_dir.exists()
-            assert manager.kanban_dir.exists()
-            assert (manager.filter_dir / "stories").exists()
 
-            # Verify kanban stages
-            expected_stages = ["planning", "in-progress", "testing", "pr", "complete"]
-            for stage in expected_stages:
-                assert (manager.kanban_dir / stage).exists()
+@pytest.fixture
+def created_manager(fresh_manager: ProjectManager) -> ProjectManager:
+    """Manager whose project structure has already been created."""
+    fresh_manager.create_project_structure()
+    return fresh_manager
 
-            # Verify README
-            readme_path = manager.filter_dir / "README.md"
-            assert readme_path.exists()
-            readme_content = readme_path.read_text()
-            assert "Filter Project" in readme_content
 
-    def test_create_project_structure_already_exists(self) -> None:
-        """Test creating project when .filter directory already exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+@pytest.fixture
+def with_stories(created_manager: ProjectManager) -> ProjectManager:
+    """Created project with two story files."""
+    _make_stories(created_manager.filter_dir / "stories", ["story1.md", "story2.md"])
+    return created_manager
 
-            # Create .filter directory first
-            manager.filter_dir.mkdir()
 
-            is_successful, message = manager.create_project_structure()
+class TestProjectManager:
+    """Tests for ProjectManager class."""
 
-            assert is_successful is False
-            assert "Filter project already exists" in message
+    def test_init(self) -> None:
+        """Test ProjectManager initialization."""
+        assert _M.project_path == _M_PATH
+        assert _M.filter_dir == _M_PATH / ".filter"
+        assert _M.kanban_dir == _M_PATH / ".filter" / "kanban"
 
-    @patch("filter.projects.shutil.rmtree")
-    def test_create_project_structure_permission_error(self, mock_rmtree) -> None:  # type: ignore[no-untyped-def]
-        """Test project creation with permission error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+    def test_create_project_structure_success(self, fresh_manager: ProjectManager) -> None:
+        """Test successful project structure creation."""
+        is_successful, message = fresh_manager.create_project_structure()
 
-            # Mock mkdir to raise OSError
-            with patch.object(Path, "mkdir", side_effect=OSError("Permission denied")):
-                is_successful, message = manager.create_project_structure()
+        assert is_successful is True
+        assert message == f"Filter project created successfully at {fresh_manager.filter_dir}"
 
-                assert is_successful is False
-                assert "Failed to create project structure" in message
+        # Verify directory structure
+        assert fresh_manager.filter_dir.exists()
+        assert fresh_manager.kanban_dir.exists()
+        assert (fresh_manager.filter_dir / "stories").exists()
 
-    def test_delete_project_structure_success(self) -> None:
-        """Test successful project deletion."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+        # Verify kanban stages
+        expected_stages = ["planning", "in-progress", "testing", "pr", "complete"]
+        for stage in expected_stages:
+            assert (fresh_manager.kanban_dir / stage).exists()
 
-            # Create project first
-            manager.create_project_structure()
-            assert manager.filter_dir.exists()
+        # Verify README
+        readme_path = fresh_manager.filter_dir / "README.md"
+        assert readme_path.exists()
+        readme_content = readme_path.read_text()
+        assert "Filter Project" in readme_content
 
-            # Delete project
-            is_successful, message = manager.delete_project_structure(force=True)
+    def test_create_project_structure_already_exists(self, fresh_manager: ProjectManager) -> None:
+        """Test creating project when .filter directory already exists."""
+        # Create .filter directory first
+        fresh_manager.filter_dir.mkdir()
 
-            assert is_successful is True
-            assert "Filter project deleted successfully" in message
-            assert not manager.filter_dir.exists()
+        is_successful, message = fresh_manager.create_project_structure()
 
-    def test_delete_project_structure_not_exists(self) -> None:
-        """Test deleting project when .filter directory doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+        assert is_successful is False
+        assert message == f"Filter project already exists at {fresh_manager.filter_dir}"
 
-            is_successful, message = manager.delete_project_structure()
+    def test_create_project_structure_permission_error(self, fresh_manager: ProjectManager) -> None:
+        """Test project creation with permission error."""
+        # Mock mkdir to raise OSError
+        with patch.object(Path, "mkdir", side_effect=OSError("Permission denied")):
+            is_successful, message = fresh_manager.create_project_structure()
 
             assert is_successful is False
-            assert "No filter project found" in message
-
-    def test_delete_project_structure_with_stories_no_force(self) -> None:
-        """Test deleting project with stories without force flag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+            assert message == "Failed to create project structure: Permission denied"
+
+    @pytest.mark.parametrize(
+        ("n_stories", "force", "expect_ok"),
+        [(0, True, True), (1, False, False), (2, True, True)],
+        ids=["empty", "stories-no-force", "stories-force"],
+    )
+    def test_delete_project_structure(
+        self, created_manager: ProjectManager, n_stories: int, force: bool, expect_ok: bool
+    ) -> None:
+        """Test deletion with and without stories, with and without force."""
+        _make_stories(created_manager.filter_dir / "stories", [f"story{i}.md" for i in range(1, n_stories + 1)])
+
+        is_successful, message = created_manager.delete_project_structure(force=force)
+
+        assert is_successful is expect_ok
+        if expect_ok:
+            assert message == f"Filter project deleted successfully from {created_manager.project_path}"
+            assert not created_manager.filter_dir.exists()
+        else:
+            assert message == f"Project contains {n_stories} stories. Use --force to delete anyway."
+            assert created_manager.filter_dir.exists()
+
+    def test_delete_project_structure_not_exists(self, ro_manager: ProjectManager) -> None:
+        """Test deleting project when .filter directory doesn't exist."""
+        is_successful, message = ro_manager.delete_project_structure()
 
-            # Create project and add a story file
-            manager.create_project_structure()
-            stories_dir = manager.filter_dir / "stories"
-            (stories_dir / "story1.md").write_text("# Story 1")
+        assert is_successful is False
+        assert message == f"No filter project found at {ro_manager.filter_dir}"
 
-            is_successful, message = manager.delete_project_structure(force=False)
+    @pytest.mark.parametrize("force", [False, True], ids=["no-force", "force"])
+    def test_delete_project_structure_filter_is_file(self, fresh_manager: ProjectManager, force: bool) -> None:
+        """Test deleting a project whose .filter is a regular file reports a failure."""
+        fresh_manager.filter_dir.write_bytes(b"")
 
-            assert is_successful is False
-            assert "contains 1 stories" in message
-            assert "Use --force" in message
-            assert manager.filter_dir.exists()
+        is_successful, message = fresh_manager.delete_project_structure(force=force)
 
-    def test_delete_project_structure_with_stories_force(self) -> None:
-        """Test deleting project with stories using force flag."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+        assert is_successful is False
+        assert message.startswith("Failed to delete project structure: ")
+        assert fresh_manager.filter_dir.is_file()
 
-            # Create project and add story files
-            manager.create_project_structure()
-            stories_dir = manager.filter_dir / "stories"
-            (stories_dir / "story1.md").write_text("# Story 1")
-            (stories_dir / "story2.md").write_text("# Story 2")
+    def test_delete_project_structure_permission_error(self, fresh_manager: ProjectManager) -> None:
+        """Test project deletion with permission error."""
+        # force=True goes straight to rmtree, so a bare .filter directory is enough
+        fresh_manager.filter_dir.mkdir(parents=True)
 
-            is_successful, message = manager.delete_project_structure(force=True)
+        # Mock rmtree to raise OSError only for our specific call
+        with patch("shutil.rmtree", side_effect=OSError("Permission denied")):
+            is_successful, message = fresh_manager.delete_project_structure(force=True)
 
-            assert is_successful is True
-            assert "Filter project deleted successfully" in message
-            assert not manager.filter_dir.exists()
+            assert is_successful is False
+            assert message == "Failed to delete project structure: Permission denied"
 
-    def test_delete_project_structure_permission_error(self) -> None:
-        """Test project deletion with permission error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+    def test_project_exists_true(self, created_manager: ProjectManager) -> None:
+        """Test project_exists when project exists."""
+        assert created_manager.project_exists() is True
 
-            # Create project first
-            manager.create_project_structure()
+    def test_project_exists_false(self, ro_manager: ProjectManager) -> None:
+        """Test project_exists when project doesn't exist."""
+        assert ro_manager.project_exists() is False
 
-            # Mock rmtree to raise OSError only for our specific call
-            with patch("filter.projects.shutil.rmtree", side_effect=OSError("Permission denied")):
-                is_successful, message = manager.delete_project_structure(force=True)
+    def test_project_exists_not_a_directory(self, fresh_manager: ProjectManager) -> None:
+        """Test project_exists when .filter is a regular file."""
+        fresh_manager.filter_dir.write_text("not a project")
 
-                assert is_successful is False
-                assert "Failed to delete project structure" in message
+        assert fresh_manager.project_exists() is False
 
-    def test_project_exists_true(self) -> None:
-        """Test project_exists when project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+    def test_get_project_info_success(self, with_stories: ProjectManager) -> None:
+        """Test getting project info for existing project."""
+        # Add story to kanban stage
+        _make_stories(with_stories.kanban_dir / "planning", ["story1.md"])
 
-            # Create project
-            manager.create_project_structure()
+        project_info = with_stories.get_project_info()
 
-            assert manager.project_exists() is True
+        assert project_info is not None
+        assert project_info["project_path"] == str(with_stories.project_path)
+        assert project_info["filter_path"] == str(with_stories.filter_dir)
+        assert project_info["total_stories"] == 2
+        assert "planning" in project_info["stage_counts"]
+        assert project_info["stage_counts"]["planning"] == 1
+        assert "created_at" in project_info
 
-    def test_project_exists_false(self) -> None:
-        """Test project_exists when project doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+    def test_get_project_info_no_project(self, ro_manager: ProjectManager) -> None:
+        """Test getting project info when no project exists."""
+        project_info = ro_manager.get_project_info()
 
-            assert manager.project_exists() is False
+        assert project_info is None
 
-    def test_get_project_info_success(self) -> None:
-        """Test getting project info for existing project."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
-
-            # Create project and add some test data
-            manager.create_project_structure()
-            stories_dir = manager.filter_dir / "stories"
-            (stories_dir / "story1.md").write_text("# Story 1")
-            (stories_dir / "story2.md").write_text("# Story 2")
-
-            # Add story to kanban stage
-            planning_dir = manager.kanban_dir / "planning"
-            (planning_dir / "story1.md").write_text("# Story 1")
-
-            project_info = manager.get_project_info()
-
-            assert project_info is not None
-            assert project_info["project_path"] == str(project_path)
-            assert project_info["filter_path"] == str(manager.filter_dir)
-            assert project_info["total_stories"] == 2
-            assert "planning" in project_info["stage_counts"]
-            assert project_info["stage_counts"]["planning"] == 1
-            assert "created_at" in project_info
-
-    def test_get_project_info_no_project(self) -> None:
-        """Test getting project info when no project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
+    @pytest.mark.parametrize("project_name", ["my-project", "yes", "2024", "it's: a #project"])
+    def test_generate_config_content(self, project_name: str) -> None:
+        """Test generated config loads back as YAML with the project's values."""
+        manager = ProjectManager(Path("/test") / project_name)
 
-            project_info = manager.get_project_info()
+        config = yaml.safe_load(manager._generate_config_content())
 
-            assert project_info is None
+        assert config["project_name"] == project_name
+        assert config["prefix"] == manager._generate_prefix(project_name)
+        assert config["last_story_number"] == 0
+        assert isinstance(config["created_at"], str)
+        assert config["kanban_stages"] == ["planning", "in-progress", "testing", "pr", "complete"]
 
     def test_generate_readme_content(self) -> None:
         """Test README content generation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = ProjectManager(project_path)
-
-            readme_content = manager._generate_readme_content()
+        readme_content = _M._generate_readme_content()
 
-            assert "# Filter Project" in readme_content
-            assert "stories/" in readme_content
-            assert "kanban/" in readme_content
-            assert "planning/" in readme_content
-            assert "filter" in readme_content.lower()
+        assert "# Filter Project" in readme_content
+        assert "stories/" in readme_content
+        assert "kanban/" in readme_content
+        assert "planning/" in readme_content
+        assert "filter" in readme_content.lower()
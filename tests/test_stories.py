@@ -1,7 +1,9 @@
 """Tests for the stories module."""
 
-import tempfile
+import os
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, Optional
 from unittest.mock import patch
 
 import pytest
@@ -9,618 +11,679 @@ import yaml
 
 from filter.stories import StoryManager
 
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+# Never touches disk: for tests of attribute wiring and pure methods only
+_M_PATH = Path("/test/project")
+_M = StoryManager(_M_PATH)
+
+_KANBAN_STAGES = ("planning", "in-progress", "testing", "pr", "complete")
+
+# Seed configs, serialized once at import
+_EXISTING_CONFIG_YAML = yaml.dump(
+    {
+        "project_name": "custom-project",
+        "prefix": "CUST",
+        "last_story_number": 5,
+        "created_at": "2024-01-01T00:00:00Z",
+        "kanban_stages": ["todo", "doing", "done"],
+    },
+    Dumper=_SafeDumper,
+    encoding="utf-8",
+)
+_PARTIAL_CONFIG_YAML = yaml.dump({"prefix": "PART", "last_story_number": 3}, Dumper=_SafeDumper, encoding="utf-8")
+
+_STORY_WITH_COLON = b"""# TITLE-1: Extract This Title
 
-class TestStoryManager:
-    """Tests for StoryManager class."""
+**Created:** 2024-01-01 12:00:00
+**Status:** Planning
 
-    def test_init(self) -> None:
-        """Test StoryManager initialization."""
-        project_path = Path("/test/project")
-        manager = StoryManager(project_path)
+## Description
 
-        assert manager.project_path == project_path
-        assert manager.filter_dir == project_path / ".filter"
-        assert manager.config_path == project_path / ".filter" / "config.yml"
-        assert manager.stories_dir == project_path / ".filter" / "stories"
-        assert manager.kanban_dir == project_path / ".filter" / "kanban"
+Test description here.
+"""
 
-    def test_generate_prefix_normal_name(self) -> None:
-        """Test prefix generation for normal project names."""
-        manager = StoryManager(Path("/test"))
+_STORY_NO_COLON = b"""# TITLE-1
 
-        # Test normal 5+ character names
-        assert manager._generate_prefix("filter") == "FILTE"
-        assert manager._generate_prefix("project-management") == "PROJE"
-        assert manager._generate_prefix("awesome_app") == "AWESO"
+**Created:** 2024-01-01 12:00:00
+"""
 
-        # Test short names
-        assert manager._generate_prefix("app") == "APPXX"
-        assert manager._generate_prefix("ui") == "UIXXX"
+_STORY_NO_HEADING = b"""**Created:** 2024-01-01 12:00:00
 
-        # Test names with numbers and dashes (regex removes trailing number/dash groups)
-        assert manager._generate_prefix("app-v2-final") == "APP-V"  # Only removes trailing, not middle
-        assert manager._generate_prefix("project_2024") == "PROJE"
+Some content without heading.
+"""
 
-    def test_ensure_filter_structure_missing(self) -> None:
-        """Test filter structure validation when .filter doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
 
-            is_valid, message = manager._ensure_filter_structure()
+def _scan(directory: Path) -> dict[str, os.DirEntry[str]]:
+    """Map each entry name in a directory to its scandir entry, in one directory read."""
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it}
 
-            assert is_valid is False
-            assert "No filter project found" in message
-            assert "filter project create" in message
 
-    def test_ensure_filter_structure_incomplete(self) -> None:
+def _build_filter_tree(manager: StoryManager) -> None:
+    """Create the project directory and its complete .filter tree.
+
+    Parents are created before children, so every mkdir succeeds first time without an
+    existence check (os.makedirs stats each parent; mkdir(parents=True) retries on ENOENT).
+    """
+    for directory in (manager.project_path, manager.filter_dir, manager.stories_dir, manager.kanban_dir):
+        directory.mkdir()
+    for stage in _KANBAN_STAGES:
+        (manager.kanban_dir / stage).mkdir()
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> StoryManager:
+    """Return a StoryManager rooted at the test's empty tmp_path."""
+    return StoryManager(tmp_path)
+
+
+@pytest.fixture
+def make_project(tmp_path: Path) -> Callable[[str], StoryManager]:
+    """Return a factory that builds a complete filter project under tmp_path.
+
+    The project directory name drives the default story prefix, so each test names its own.
+    """
+
+    def _make(name: str) -> StoryManager:
+        manager = StoryManager(tmp_path / name)
+        _build_filter_tree(manager)
+        return manager
+
+    return _make
+
+
+class TestStoryManager:
+    """Tests for StoryManager setup, naming and project checks."""
+
+    def test_init(self) -> None:
+        """Test StoryManager initialization."""
+        assert _M.project_path == _M_PATH
+        assert _M.filter_dir == _M_PATH / ".filter"
+        assert _M.config_path == _M_PATH / ".filter" / "config.yml"
+        assert _M.stories_dir == _M_PATH / ".filter" / "stories"
+        assert _M.kanban_dir == _M_PATH / ".filter" / "kanban"
+
+    @pytest.mark.parametrize(
+        ("name", "expected"),
+        [
+            # Normal 5+ character names
+            ("filter", "FILTE"),
+            ("project-management", "PROJE"),
+            ("awesome_app", "AWESO"),
+            # Short names
+            ("app", "APPXX"),
+            ("ui", "UIXXX"),
+            # Names with numbers and dashes (regex removes trailing number/dash groups)
+            ("app-v2-final", "APP-V"),  # Only removes trailing, not middle
+            ("project_2024", "PROJE"),
+        ],
+    )
+    def test_generate_prefix(self, name: str, expected: str) -> None:
+        """Test prefix generation from project names."""
+        assert _M._generate_prefix(name) == expected
+
+    def test_ensure_filter_structure_missing(self, manager: StoryManager) -> None:
+        """Test filter structure validation when .filter doesn't exist."""
+        is_valid, message = manager._ensure_filter_structure()
+
+        assert is_valid is False
+        assert "No filter project found" in message
+        assert "filter project create" in message
+
+    def test_ensure_filter_structure_incomplete(self, manager: StoryManager) -> None:
         """Test filter structure validation when directories are missing."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Create .filter but missing stories directory
+        manager.filter_dir.mkdir()
+        manager.kanban_dir.mkdir()
+
+        is_valid, message = manager._ensure_filter_structure()
+
+        assert is_valid is False
+        assert "Missing required directory" in message
 
-            # Create .filter but missing stories directory
-            manager.filter_dir.mkdir()
-            manager.kanban_dir.mkdir()
+    def test_ensure_filter_structure_unreadable(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test an unreadable .filter is reported as a failure rather than raised."""
+        manager = make_project("locked-test")
 
+        # Root can list any directory, so the missing read permission is simulated
+        with patch("filter.stories.os.scandir", side_effect=PermissionError(13, "Permission denied")):
             is_valid, message = manager._ensure_filter_structure()
 
             assert is_valid is False
-            assert "Missing required directory" in message
+            assert message == f"Cannot read filter project at {manager.filter_dir}: [Errno 13] Permission denied"
+            assert manager.create_story("Locked Story")[0] is False
+            assert manager.delete_story("LOCKE-1")[0] is False
+            assert manager.list_stories() == []
 
-    def test_ensure_filter_structure_valid(self) -> None:
+    def test_ensure_filter_structure_valid(self, manager: StoryManager) -> None:
         """Test filter structure validation when complete."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Create complete structure
+        manager.filter_dir.mkdir()
+        manager.stories_dir.mkdir()
+        manager.kanban_dir.mkdir()
 
-            # Create complete structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
+        is_valid, message = manager._ensure_filter_structure()
 
-            is_valid, message = manager._ensure_filter_structure()
+        assert is_valid is True
+        assert "Filter structure verified" in message
 
-            assert is_valid is True
-            assert "Filter structure verified" in message
+    def test_ensure_filter_structure_cached_until_failure(self, manager: StoryManager) -> None:
+        """Test a verified structure is remembered until a filesystem operation fails."""
+        # Create complete structure
+        manager.filter_dir.mkdir()
+        manager.stories_dir.mkdir()
+        manager.kanban_dir.mkdir()
+        assert manager._ensure_filter_structure()[0] is True
 
-    def test_load_config_creates_default(self) -> None:
-        """Test config loading creates default when file doesn't exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "test-project"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
+        manager.stories_dir.rmdir()
+        assert manager._ensure_filter_structure()[0] is True
 
-            # Create minimal .filter structure
-            manager.filter_dir.mkdir()
+        is_successful, _ = manager.create_story("Lost Story")
+        assert is_successful is False
 
-            config = manager._load_config()
+        is_valid, message = manager._ensure_filter_structure()
+        assert is_valid is False
+        assert "Missing required directory" in message
 
-            assert config["project_name"] == "test-project"
-            assert config["prefix"] == "TEST-"  # Updated to match actual output
-            assert config["last_story_number"] == 0
-            assert "created_at" in config
-            assert config["kanban_stages"] == ["planning", "in-progress", "testing", "pr", "complete"]
-
-            # Verify config file was created
-            assert manager.config_path.exists()
-
-    def test_load_config_existing_file(self) -> None:
-        """Test config loading from existing file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
-
-            # Create .filter structure and config
-            manager.filter_dir.mkdir()
-            existing_config = {
-                "project_name": "custom-project",
-                "prefix": "CUST",
-                "last_story_number": 5,
-                "created_at": "2024-01-01T00:00:00Z",
-                "kanban_stages": ["todo", "doing", "done"],
-            }
-
-            with manager.config_path.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(existing_config, f)
+    def test_get_project_config_valid_project(self, tmp_path: Path) -> None:
+        """Test getting project config for valid project."""
+        project_path = tmp_path / "config-test"
+        project_path.mkdir()
+        manager = StoryManager(project_path)
 
-            config = manager._load_config()
+        # Create complete project structure
+        manager.filter_dir.mkdir()
+        manager.stories_dir.mkdir()
+        manager.kanban_dir.mkdir()
 
-            assert config["project_name"] == "custom-project"
-            assert config["prefix"] == "CUST"
-            assert config["last_story_number"] == 5
-            assert config["kanban_stages"] == ["todo", "doing", "done"]
+        config = manager.get_project_config()
 
-    def test_load_config_partial_file(self) -> None:
-        """Test config loading merges missing keys with defaults."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "merge-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
+        assert config is not None
+        assert config["project_name"] == "config-test"
+        assert config["prefix"] == "CONFI"
+        assert config["last_story_number"] == 0
+        assert "created_at" in config
+        assert config["kanban_stages"] == list(_KANBAN_STAGES)
 
-            # Create .filter structure and partial config
-            manager.filter_dir.mkdir()
-            partial_config = {"prefix": "PART", "last_story_number": 3}
+    def test_get_project_config_no_project(self, manager: StoryManager) -> None:
+        """Test getting project config when no project exists."""
+        config = manager.get_project_config()
 
-            with manager.config_path.open("w", encoding="utf-8") as f:
-                yaml.safe_dump(partial_config, f)
+        assert config is None
 
-            config = manager._load_config()
+    def test_generate_story_content(self) -> None:
+        """Test story content generation."""
+        content = _M._generate_story_content("TEST-1", "Test Story", "A test description")
 
-            # Should merge with defaults
-            assert config["prefix"] == "PART"  # from file
-            assert config["last_story_number"] == 3  # from file
-            assert config["project_name"] == "merge-test"  # default
-            assert "created_at" in config  # default
-            assert config["kanban_stages"] == ["planning", "in-progress", "testing", "pr", "complete"]  # default
+        assert "# TEST-1: Test Story" in content
+        assert "**Status:** Planning" in content
+        assert "A test description" in content
+        assert "## Acceptance Criteria" in content
+        assert "## Notes" in content
+        assert "## Related Issues" in content
 
-    def test_load_config_corrupted_file(self) -> None:
-        """Test config loading with corrupted YAML file."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "corrupted-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
+    def test_generate_story_content_no_description(self) -> None:
+        """Test story content generation with no description."""
+        content = _M._generate_story_content("TEST-1", "Test Story", "")
+
+        assert "# TEST-1: Test Story" in content
+        assert "No description provided." in content
+
+
+class TestConfig:
+    """Tests for loading, caching and saving the project config."""
+
+    @pytest.mark.parametrize(
+        ("project_name", "preseed", "expected"),
+        [
+            (
+                "test-project",
+                None,
+                {
+                    "project_name": "test-project",
+                    "prefix": "TEST-",  # Updated to match actual output
+                    "last_story_number": 0,
+                    "kanban_stages": list(_KANBAN_STAGES),
+                },
+            ),
+            (
+                "custom",
+                _EXISTING_CONFIG_YAML,
+                {
+                    "project_name": "custom-project",
+                    "prefix": "CUST",
+                    "last_story_number": 5,
+                    "kanban_stages": ["todo", "doing", "done"],
+                },
+            ),
+            (
+                "merge-test",
+                _PARTIAL_CONFIG_YAML,
+                {
+                    "prefix": "PART",  # from file
+                    "last_story_number": 3,  # from file
+                    "project_name": "merge-test",  # default
+                    "kanban_stages": list(_KANBAN_STAGES),  # default
+                },
+            ),
+            (
+                "corrupted-test",
+                b"invalid: yaml: content: [unclosed",
+                {"project_name": "corrupted-test", "prefix": "CORRU", "last_story_number": 0},  # defaults
+            ),
+        ],
+        ids=["creates-default", "existing-file", "partial-file", "corrupted-file"],
+    )
+    def test_load_config(
+        self, tmp_path: Path, project_name: str, preseed: Optional[bytes], expected: dict[str, Any]
+    ) -> None:
+        """Test config loading from no file, a full file, a partial file and a corrupted file."""
+        manager = StoryManager(tmp_path / project_name)
+        manager.filter_dir.mkdir(parents=True)
+        if preseed is not None:
+            manager.config_path.write_bytes(preseed)
+
+        config = manager._load_config()
+
+        assert expected.items() <= config.items()
+        assert "created_at" in config
+        # A missing config is written out with the defaults
+        assert manager.config_path.exists()
+
+    def test_load_config_uses_cache(self, manager: StoryManager) -> None:
+        """Test config loading reuses the parsed config while the file is unchanged."""
+        manager.filter_dir.mkdir()
+        manager._save_config({"prefix": "CACHE", "last_story_number": 1})
+
+        with patch("yaml.load") as mock_load:
+            config = manager._load_config()
+            config["last_story_number"] = 99
 
-            # Create .filter structure and corrupted config
-            manager.filter_dir.mkdir()
-            manager.config_path.write_text("invalid: yaml: content: [unclosed", encoding="utf-8")
+            assert manager._load_config()["last_story_number"] == 1
+            mock_load.assert_not_called()
 
-            config = manager._load_config()
+    def test_load_config_reloads_changed_file(self, manager: StoryManager) -> None:
+        """Test config loading picks up edits made outside the manager."""
+        manager.filter_dir.mkdir()
+        manager._save_config({"prefix": "CACHE", "last_story_number": 1})
+
+        manager.config_path.write_text("prefix: EDITED\nlast_story_number: 12\n", encoding="utf-8")
 
-            # Should fall back to defaults
-            assert config["project_name"] == "corrupted-test"
-            assert config["prefix"] == "CORRU"
-            assert config["last_story_number"] == 0
+        config = manager._load_config()
+        assert config["prefix"] == "EDITED"
+        assert config["last_story_number"] == 12
 
-    def test_save_config(self) -> None:
+    def test_save_config(self, manager: StoryManager) -> None:
         """Test config saving."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Create .filter structure
+        manager.filter_dir.mkdir()
 
-            # Create .filter structure
-            manager.filter_dir.mkdir()
+        test_config = {
+            "project_name": "test",
+            "prefix": "TEST",
+            "last_story_number": 10,
+            "created_at": "2024-01-01T00:00:00Z",
+            "kanban_stages": ["planning", "done"],
+        }
 
-            test_config = {
-                "project_name": "test",
-                "prefix": "TEST",
-                "last_story_number": 10,
-                "created_at": "2024-01-01T00:00:00Z",
-                "kanban_stages": ["planning", "done"],
-            }
+        manager._save_config(test_config)
 
-            manager._save_config(test_config)
+        # Verify file was written correctly
+        assert manager.config_path.exists()
+
+        with manager.config_path.open(encoding="utf-8") as f:
+            saved_config = yaml.load(f, Loader=_SafeLoader)
+
+        assert saved_config == test_config
+
+    def test_save_config_leaves_no_temporary_files(self, manager: StoryManager) -> None:
+        """Test config saving renames its temporary file into place."""
+        manager.filter_dir.mkdir()
+
+        manager._save_config({"prefix": "ATOM", "last_story_number": 1})
+        manager._save_config({"prefix": "ATOM", "last_story_number": 2})
+
+        assert [p.name for p in manager.filter_dir.iterdir()] == ["config.yml"]
+        assert yaml.load(manager.config_path.read_bytes(), Loader=_SafeLoader)["last_story_number"] == 2
 
-            # Verify file was written correctly
-            assert manager.config_path.exists()
+    def test_save_config_ignores_stale_temporary_file(self, manager: StoryManager) -> None:
+        """Test a temporary file left behind by a crashed writer does not block saving."""
+        manager.filter_dir.mkdir()
+        stale = manager.filter_dir / f".config.yml.{os.getpid()}.tmp"
+        stale.write_bytes(b"partial")
+        fresh = manager.filter_dir / ".config.yml.inflight.tmp"
+        fresh.write_bytes(b"partial")
+        # Backdate the abandoned file; the fresh one may still belong to a concurrent writer
+        os.utime(stale, (0, 0))
 
-            with manager.config_path.open(encoding="utf-8") as f:
-                saved_config = yaml.safe_load(f)
+        manager._save_config({"prefix": "STALE", "last_story_number": 3})
 
-            assert saved_config == test_config
+        assert yaml.load(manager.config_path.read_bytes(), Loader=_SafeLoader)["last_story_number"] == 3
+        assert sorted(p.name for p in manager.filter_dir.iterdir()) == [fresh.name, "config.yml"]
 
-    def test_save_config_permission_error(self) -> None:
+    def test_save_config_keeps_existing_mode(self, manager: StoryManager) -> None:
+        """Test saving over config.yml keeps the permissions it already had."""
+        manager.filter_dir.mkdir()
+        manager._save_config({"prefix": "MODE", "last_story_number": 1})
+        manager.config_path.chmod(0o600)
+
+        manager._save_config({"prefix": "MODE", "last_story_number": 2})
+
+        assert manager.config_path.stat().st_mode & 0o777 == 0o600
+
+    def test_save_config_writes_through_symlink(self, manager: StoryManager) -> None:
+        """Test a symlinked config.yml stays a link and its target gets the new content."""
+        manager.filter_dir.mkdir()
+        shared = manager.project_path / "shared-config.yml"
+        shared.write_bytes(b"prefix: LINK\nlast_story_number: 1\n")
+        manager.config_path.symlink_to(shared)
+
+        manager._save_config({"prefix": "LINK", "last_story_number": 2})
+
+        assert manager.config_path.is_symlink()
+        assert yaml.load(shared.read_bytes(), Loader=_SafeLoader)["last_story_number"] == 2
+
+    def test_save_config_permission_error(self, manager: StoryManager) -> None:
         """Test config saving with permission error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        test_config = {"test": "value"}
 
-            test_config = {"test": "value"}
+        # A directory in place of config.yml makes the final rename fail for real
+        manager.config_path.mkdir(parents=True)
 
-            # Create the filter directory first
-            manager.filter_dir.mkdir()
+        with pytest.raises(OSError):
+            manager._save_config(test_config)
 
-            # Patch yaml.safe_dump to raise an error
-            with (
-                patch("yaml.safe_dump", side_effect=OSError("Permission denied")),
-                pytest.raises(OSError),
-            ):
-                manager._save_config(test_config)
+        # The temporary file is cleaned up, not left beside the config
+        assert [p.name for p in manager.filter_dir.iterdir()] == ["config.yml"]
 
-    def test_get_next_story_number(self) -> None:
+    def test_get_next_story_number(self, tmp_path: Path) -> None:
         """Test story number generation and config update."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "story-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
+        project_path = tmp_path / "story-test"
+        project_path.mkdir()
+        manager = StoryManager(project_path)
 
-            # Create .filter structure
-            manager.filter_dir.mkdir()
+        # Create .filter structure
+        manager.filter_dir.mkdir()
 
-            # First story should be 1
-            number, story_id = manager._get_next_story_number()
-            assert number == 1
-            assert story_id == "STORY-1"
+        # First story should be 1
+        number, story_id = manager._get_next_story_number()
+        assert number == 1
+        assert story_id == "STORY-1"
 
-            # Second story should be 2
-            number, story_id = manager._get_next_story_number()
-            assert number == 2
-            assert story_id == "STORY-2"
+        # Second story should be 2
+        number, story_id = manager._get_next_story_number()
+        assert number == 2
+        assert story_id == "STORY-2"
 
-            # Verify config was updated
-            config = manager._load_config()
-            assert config["last_story_number"] == 2
+        # Verify the counter reached config.yml itself, not just the in-memory cache
+        saved_config = yaml.load(manager.config_path.read_bytes(), Loader=_SafeLoader)
+        assert saved_config["last_story_number"] == 2
+
+
+class TestCreateStory:
+    """Tests for StoryManager.create_story."""
 
-    def test_create_story_success(self) -> None:
+    def test_create_story_success(self, make_project: Callable[[str], StoryManager]) -> None:
         """Test successful story creation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "create-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
-
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-            for stage in ["planning", "in-progress", "testing", "pr", "complete"]:
-                (manager.kanban_dir / stage).mkdir()
-
-            is_successful, message = manager.create_story("Test Story", "A test story description", "planning")
-
-            assert is_successful is True
-            assert "Created story CREAT-1: Test Story" in message
-
-            # Verify story file was created
-            story_file = manager.stories_dir / "CREAT-1.md"
-            assert story_file.exists()
-
-            story_content = story_file.read_text(encoding="utf-8")
-            assert "# CREAT-1: Test Story" in story_content
-            assert "A test story description" in story_content
-            assert "**Status:** Planning" in story_content
-
-            # Verify kanban symlink was created
-            kanban_link = manager.kanban_dir / "planning" / "CREAT-1.md"
-            assert kanban_link.exists()
-            assert kanban_link.is_symlink()
-
-    def test_create_story_no_filter_project(self) -> None:
-        """Test story creation when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        manager = make_project("create-test")
 
-            is_successful, message = manager.create_story("Test Story")
+        is_successful, message = manager.create_story("Test Story", "A test story description", "planning")
 
-            assert is_successful is False
-            assert "No filter project found" in message
+        assert is_successful is True
+        assert "Created story CREAT-1: Test Story" in message
 
-    def test_create_story_invalid_stage(self) -> None:
-        """Test story creation with invalid stage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Verify story file was created
+        assert "CREAT-1.md" in _scan(manager.stories_dir)
 
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
+        story_content = (manager.stories_dir / "CREAT-1.md").read_text(encoding="utf-8")
+        assert "# CREAT-1: Test Story" in story_content
+        assert "A test story description" in story_content
+        assert "**Status:** Planning" in story_content
 
-            is_successful, message = manager.create_story("Test Story", "", "invalid-stage")
+        # Verify kanban symlink was created and resolves to the story file
+        kanban_link = _scan(manager.kanban_dir / "planning")["CREAT-1.md"]
+        assert kanban_link.is_symlink()
+        assert kanban_link.is_file()
 
-            assert is_successful is False
-            assert "Invalid stage 'invalid-stage'" in message
-            assert "Valid stages:" in message
+    def test_create_story_no_filter_project(self, manager: StoryManager) -> None:
+        """Test story creation when no filter project exists."""
+        is_successful, message = manager.create_story("Test Story")
 
-    def test_create_story_file_error(self) -> None:
+        assert is_successful is False
+        assert "No filter project found" in message
+
+    def test_create_story_invalid_stage(self, manager: StoryManager) -> None:
+        """Test story creation with invalid stage."""
+        # Create complete project structure
+        manager.filter_dir.mkdir()
+        manager.stories_dir.mkdir()
+        manager.kanban_dir.mkdir()
+
+        is_successful, message = manager.create_story("Test Story", "", "invalid-stage")
+
+        assert is_successful is False
+        assert "Invalid stage 'invalid-stage'" in message
+        assert "Valid stages:" in message
+
+    def test_create_story_file_error(self, make_project: Callable[[str], StoryManager]) -> None:
         """Test story creation with file creation error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        manager = make_project("error-test")
 
-            # Create minimal structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-            (manager.kanban_dir / "planning").mkdir()
+        # A directory where the story file should go makes the write fail for real
+        (manager.stories_dir / "ERROR-1.md").mkdir()
 
-            # Mock story file write to fail
-            with patch.object(Path, "write_text", side_effect=OSError("Disk full")):
-                is_successful, message = manager.create_story("Test Story")
+        is_successful, message = manager.create_story("Test Story")
 
-                assert is_successful is False
-                assert "Failed to create story" in message
+        assert is_successful is False
+        assert "Failed to create story" in message
 
-    def test_delete_story_success(self) -> None:
-        """Test successful story deletion."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "delete-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
-
-            # Create complete project structure and story
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-            for stage in ["planning", "in-progress", "testing", "pr", "complete"]:
-                (manager.kanban_dir / stage).mkdir()
-
-            # Create story first
-            manager.create_story("Test Story")
-
-            # Verify story exists
-            story_file = manager.stories_dir / "DELET-1.md"
-            kanban_link = manager.kanban_dir / "planning" / "DELET-1.md"
-            assert story_file.exists()
-            assert kanban_link.exists()
-
-            # Delete story
-            is_successful, message = manager.delete_story("DELET-1")
-
-            assert is_successful is True
-            assert "Deleted story DELET-1" in message
-            assert "(was in planning)" in message
-
-            # Verify files were removed
-            assert not story_file.exists()
-            assert not kanban_link.exists()
-
-    def test_delete_story_not_found(self) -> None:
-        """Test deleting non-existent story."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
 
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
+class TestDeleteStory:
+    """Tests for StoryManager.delete_story."""
 
-            is_successful, message = manager.delete_story("NONEX-1")
+    def test_delete_story_success(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test successful story deletion."""
+        manager = make_project("delete-test")
 
-            assert is_successful is False
-            assert "Story NONEX-1 not found" in message
+        # Create story first
+        manager.create_story("Test Story")
 
-    def test_delete_story_no_filter_project(self) -> None:
-        """Test story deletion when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Verify story exists
+        planning_dir = manager.kanban_dir / "planning"
+        assert "DELET-1.md" in _scan(manager.stories_dir)
+        assert "DELET-1.md" in _scan(planning_dir)
 
-            is_successful, message = manager.delete_story("TEST-1")
+        # Delete story
+        is_successful, message = manager.delete_story("DELET-1")
 
-            assert is_successful is False
-            assert "No filter project found" in message
+        assert is_successful is True
+        assert "Deleted story DELET-1" in message
+        assert "(was in planning)" in message
 
-    def test_delete_story_file_error(self) -> None:
-        """Test story deletion with file removal error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Verify files were removed
+        assert "DELET-1.md" not in _scan(manager.stories_dir)
+        assert "DELET-1.md" not in _scan(planning_dir)
 
-            # Create complete project structure and story
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-            (manager.kanban_dir / "planning").mkdir()
+    def test_delete_story_not_found(self, manager: StoryManager) -> None:
+        """Test deleting non-existent story."""
+        # Create complete project structure
+        manager.filter_dir.mkdir()
+        manager.stories_dir.mkdir()
+        manager.kanban_dir.mkdir()
 
-            # Create story manually
-            story_file = manager.stories_dir / "ERROR-1.md"
-            story_file.write_text("# ERROR-1: Test Story")
+        is_successful, message = manager.delete_story("NONEX-1")
 
-            # Mock file unlink to fail
-            with patch.object(Path, "unlink", side_effect=OSError("Permission denied")):
-                is_successful, message = manager.delete_story("ERROR-1")
+        assert is_successful is False
+        assert "Story NONEX-1 not found" in message
 
-                assert is_successful is False
-                assert "Failed to delete story" in message
+    def test_delete_story_no_filter_project(self, manager: StoryManager) -> None:
+        """Test story deletion when no filter project exists."""
+        is_successful, message = manager.delete_story("TEST-1")
 
-    def test_list_stories_empty(self) -> None:
-        """Test listing stories when none exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        assert is_successful is False
+        assert "No filter project found" in message
 
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
+    def test_delete_story_file_error(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test story deletion with file removal error."""
+        manager = make_project("error-test")
 
-            stories = manager.list_stories()
+        # The story "file" exists but is a directory, so unlinking it fails for real
+        (manager.stories_dir / "ERROR-1.md").mkdir()
 
-            assert stories == []
+        is_successful, message = manager.delete_story("ERROR-1")
 
-    def test_list_stories_multiple(self) -> None:
-        """Test listing multiple stories across stages."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "lists-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
-
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-            for stage in ["planning", "in-progress", "testing", "pr", "complete"]:
-                (manager.kanban_dir / stage).mkdir()
-
-            # Create stories
-            manager.create_story("Story One")
-            manager.create_story("Story Two", "", "in-progress")
-
-            stories = manager.list_stories()
-
-            assert len(stories) == 2
-            assert stories[0]["id"] == "LISTS-1"
-            assert stories[0]["title"] == "Story One"
-            assert stories[0]["stage"] == "planning"
-            assert stories[1]["id"] == "LISTS-2"
-            assert stories[1]["title"] == "Story Two"
-            assert stories[1]["stage"] == "in-progress"
-
-    def test_list_stories_filtered_by_stage(self) -> None:
-        """Test listing stories filtered by specific stage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "filter-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
-
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-            for stage in ["planning", "in-progress", "testing", "pr", "complete"]:
-                (manager.kanban_dir / stage).mkdir()
-
-            # Create stories in different stages
-            manager.create_story("Planning Story", "", "planning")
-            manager.create_story("Progress Story", "", "in-progress")
-            manager.create_story("Another Planning Story", "", "planning")
-
-            # Filter by planning stage
-            planning_stories = manager.list_stories("planning")
-
-            assert len(planning_stories) == 2
-            assert all(story["stage"] == "planning" for story in planning_stories)
-            # Stories may be returned in different order, so just check titles are present
-            planning_titles = [story["title"] for story in planning_stories]
-            assert "Planning Story" in planning_titles
-            assert "Another Planning Story" in planning_titles
-
-            # Filter by in-progress stage
-            progress_stories = manager.list_stories("in-progress")
-
-            assert len(progress_stories) == 1
-            assert progress_stories[0]["title"] == "Progress Story"
-
-    def test_list_stories_no_filter_project(self) -> None:
-        """Test listing stories when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        assert is_successful is False
+        assert "Failed to delete story" in message
 
-            stories = manager.list_stories()
 
-            assert stories == []
+class TestListStories:
+    """Tests for StoryManager.list_stories."""
 
-    def test_extract_title_from_story(self) -> None:
-        """Test title extraction from story markdown files."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+    def test_list_stories_empty(self, manager: StoryManager) -> None:
+        """Test listing stories when none exist."""
+        # Create complete project structure
+        manager.filter_dir.mkdir()
+        manager.stories_dir.mkdir()
+        manager.kanban_dir.mkdir()
 
-            # Create test story file
-            story_file = Path(temp_dir) / "test-story.md"
-            story_content = """# TITLE-1: Extract This Title
+        stories = manager.list_stories()
 
-**Created:** 2024-01-01 12:00:00
-**Status:** Planning
+        assert stories == []
 
-## Description
+    def test_list_stories_multiple(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test listing multiple stories across stages."""
+        manager = make_project("lists-test")
 
-Test description here.
-"""
-            story_file.write_text(story_content, encoding="utf-8")
+        # Create stories
+        manager.create_story("Story One")
+        manager.create_story("Story Two", "", "in-progress")
 
-            title = manager._extract_title_from_story(story_file)
+        stories = manager.list_stories()
 
-            assert title == "Extract This Title"
+        assert len(stories) == 2
+        assert stories[0]["id"] == "LISTS-1"
+        assert stories[0]["title"] == "Story One"
+        assert stories[0]["stage"] == "planning"
+        assert stories[1]["id"] == "LISTS-2"
+        assert stories[1]["title"] == "Story Two"
+        assert stories[1]["stage"] == "in-progress"
 
-    def test_extract_title_from_story_no_colon(self) -> None:
-        """Test title extraction when no colon separator exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+    def test_list_stories_includes_dot_named_links(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test a dot-named story link is listed, as the original *.md glob matched it."""
+        manager = make_project("dots-test")
+        (manager.stories_dir / ".DOTS-1.md").write_bytes(b"# Hidden Story\n")
+        (manager.kanban_dir / "planning" / ".DOTS-1.md").symlink_to("../../stories/.DOTS-1.md")
 
-            # Create test story file without colon
-            story_file = Path(temp_dir) / "test-story.md"
-            story_content = """# TITLE-1
+        stories = manager.list_stories()
 
-**Created:** 2024-01-01 12:00:00
-"""
-            story_file.write_text(story_content, encoding="utf-8")
+        assert stories == [{"id": ".DOTS-1", "title": "Hidden Story", "stage": "planning"}]
 
-            title = manager._extract_title_from_story(story_file)
+    def test_list_stories_skips_stage_that_is_a_file(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test a stage path that is a regular file is skipped, not fatal to the listing."""
+        manager = make_project("files-test")
+        manager.create_story("Kept Story", "", "in-progress")
+        planning_dir = manager.kanban_dir / "planning"
+        planning_dir.rmdir()
+        planning_dir.write_bytes(b"")
 
-            assert title == "TITLE-1"
+        stories = manager.list_stories()
 
-    def test_extract_title_from_story_no_heading(self) -> None:
-        """Test title extraction when no heading exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        assert stories == [{"id": "FILES-1", "title": "Kept Story", "stage": "in-progress"}]
 
-            # Create test story file without heading
-            story_file = Path(temp_dir) / "test-story.md"
-            story_content = """**Created:** 2024-01-01 12:00:00
+    def test_list_stories_filtered_by_stage(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test listing stories filtered by specific stage."""
+        manager = make_project("filter-test")
 
-Some content without heading.
-"""
-            story_file.write_text(story_content, encoding="utf-8")
+        # Create stories in different stages
+        manager.create_story("Planning Story", "", "planning")
+        manager.create_story("Progress Story", "", "in-progress")
+        manager.create_story("Another Planning Story", "", "planning")
 
-            title = manager._extract_title_from_story(story_file)
+        # Filter by planning stage
+        planning_stories = manager.list_stories("planning")
 
-            assert title == "test-story"
+        assert len(planning_stories) == 2
+        assert all(story["stage"] == "planning" for story in planning_stories)
+        # Stories may be returned in different order, so just check titles are present
+        planning_titles = [story["title"] for story in planning_stories]
+        assert "Planning Story" in planning_titles
+        assert "Another Planning Story" in planning_titles
 
-    def test_extract_title_from_story_file_error(self) -> None:
-        """Test title extraction with file read error."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        # Filter by in-progress stage
+        progress_stories = manager.list_stories("in-progress")
 
-            # Create test story file
-            story_file = Path(temp_dir) / "test-story.md"
-            story_file.write_text("# TEST: Title", encoding="utf-8")
+        assert len(progress_stories) == 1
+        assert progress_stories[0]["title"] == "Progress Story"
 
-            # Mock read_text to fail
-            with patch.object(Path, "read_text", side_effect=OSError("Permission denied")):
-                title = manager._extract_title_from_story(story_file)
+    def test_list_stories_skips_dangling_and_plain_files(self, make_project: Callable[[str], StoryManager]) -> None:
+        """Test listing ignores broken links, regular files and non-markdown entries."""
+        manager = make_project("skips-test")
 
-                assert title == "test-story"
+        manager.create_story("Kept Story")
+        planning_dir = manager.kanban_dir / "planning"
+        (planning_dir / "GHOST-1.md").symlink_to("../../stories/GHOST-1.md")
+        (planning_dir / "PLAIN-1.md").write_text("# PLAIN-1: Not a link", encoding="utf-8")
+        (planning_dir / "notes.txt").symlink_to("../../stories/SKIPS-1.md")
 
-    def test_get_project_config_valid_project(self) -> None:
-        """Test getting project config for valid project."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir) / "config-test"
-            project_path.mkdir()
-            manager = StoryManager(project_path)
-
-            # Create complete project structure
-            manager.filter_dir.mkdir()
-            manager.stories_dir.mkdir()
-            manager.kanban_dir.mkdir()
-
-            config = manager.get_project_config()
-
-            assert config is not None
-            assert config["project_name"] == "config-test"
-            assert config["prefix"] == "CONFI"
-            assert config["last_story_number"] == 0
-            assert "created_at" in config
-            assert config["kanban_stages"] == ["planning", "in-progress", "testing", "pr", "complete"]
-
-    def test_get_project_config_no_project(self) -> None:
-        """Test getting project config when no project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        stories = manager.list_stories()
 
-            config = manager.get_project_config()
+        assert stories == [{"id": "SKIPS-1", "title": "Kept Story", "stage": "planning"}]
 
-            assert config is None
+    def test_list_stories_no_filter_project(self, manager: StoryManager) -> None:
+        """Test listing stories when no filter project exists."""
+        stories = manager.list_stories()
 
-    def test_generate_story_content(self) -> None:
-        """Test story content generation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+        assert stories == []
 
-            content = manager._generate_story_content("TEST-1", "Test Story", "A test description")
 
-            assert "# TEST-1: Test Story" in content
-            assert "**Status:** Planning" in content
-            assert "A test description" in content
-            assert "## Acceptance Criteria" in content
-            assert "## Notes" in content
-            assert "## Related Issues" in content
+class TestExtractTitle:
+    """Tests for reading story titles from markdown files."""
 
-    def test_generate_story_content_no_description(self) -> None:
-        """Test story content generation with no description."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = Path(temp_dir)
-            manager = StoryManager(project_path)
+    @pytest.mark.parametrize(
+        ("story_content", "expected"),
+        [
+            (_STORY_WITH_COLON, "Extract This Title"),
+            (_STORY_NO_COLON, "TITLE-1"),
+            (_STORY_NO_HEADING, "test-story"),  # falls back to the file stem
+        ],
+        ids=["colon", "no-colon", "no-heading"],
+    )
+    def test_extract_title_from_story(self, manager: StoryManager, story_content: bytes, expected: str) -> None:
+        """Test title extraction from story markdown files."""
+        story_file = manager.project_path / "test-story.md"
+        story_file.write_bytes(story_content)
+
+        assert manager._extract_title_from_story(story_file) == expected
+
+    @pytest.mark.parametrize(
+        ("preamble", "title"),
+        [
+            ("x" * 5000 + "\n", "Late Heading"),
+            ("x" * 4090 + "\n", "Straddling Heading"),
+            ("", "Long Heading " + "y" * 5000),
+        ],
+    )
+    def test_extract_title_from_story_beyond_first_block(
+        self, manager: StoryManager, preamble: str, title: str
+    ) -> None:
+        """Test title extraction when the heading is not inside the first block read."""
+        story_file = manager.project_path / "test-story.md"
+        story_file.write_text(f"{preamble}# TEST-1: {title}\n\nBody\n", encoding="utf-8")
+
+        assert manager._extract_title_from_story(story_file) == title
+
+    def test_extract_title_from_story_file_error(self, manager: StoryManager) -> None:
+        """Test title extraction with file read error."""
+        # A directory in place of the story makes the read fail for real
+        story_file = manager.project_path / "test-story.md"
+        story_file.mkdir()
 
-            content = manager._generate_story_content("TEST-1", "Test Story", "")
+        title = manager._extract_title_from_story(story_file)
 
-            assert "# TEST-1: Test Story" in content
-            assert "No description provided." in content
+        assert title == "test-story"
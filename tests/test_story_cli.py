@@ -1,50 +1,24 @@
 """Tests for the story CLI commands."""
 
-import tempfile
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import Mock
 
+import pytest
 from click.testing import CliRunner
 
+from filter.stories import StoryManager
 from filter.story_cli import story
 
+# CliRunner keeps no state between invocations, so one instance serves every test
+_RUNNER = CliRunner()
 
-class TestStoryCLI:
-    """Tests for story CLI commands."""
-
-    def setup_method(self) -> None:
-        """Set up test environment."""
-        self.runner = CliRunner()
-
-    def create_test_project(self, temp_dir: str) -> Path:
-        """Create a complete test project structure.
-
-        Args:
-            temp_dir: Temporary directory path
-
-        Returns:
-            Path to project directory
-        """
-        project_path = Path(temp_dir) / "test-project"
-        project_path.mkdir()
-
-        # Create complete .filter structure
-        filter_dir = project_path / ".filter"
-        filter_dir.mkdir()
-
-        stories_dir = filter_dir / "stories"
-        stories_dir.mkdir()
-
-        kanban_dir = filter_dir / "kanban"
-        kanban_dir.mkdir()
+# Status markers the story commands put in front of their result lines
+_OK = "✓ "
+_FAIL = "✗ "
 
-        # Create kanban stages
-        for stage in ["planning", "in-progress", "testing", "pr", "complete"]:
-            (kanban_dir / stage).mkdir()
+_KANBAN_STAGES = ("planning", "in-progress", "testing", "pr", "complete")
 
-        # Create config.yml
-        config_path = filter_dir / "config.yml"
-        config_content = """project_name: test-project
+_CONFIG_BYTES = b"""project_name: test-project
 prefix: TESTP
 last_story_number: 0
 created_at: '2024-01-01T00:00:00Z'
@@ -55,318 +29,278 @@ kanban_stages:
 - pr
 - complete
 """
-        config_path.write_text(config_content, encoding="utf-8")
-
-        return project_path
-
-    def test_create_story_success(self) -> None:
-        """Test successful story creation via CLI."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            result = self.runner.invoke(
-                story, ["create", "Test Story", "--description", "A test story", "--project-path", str(project_path)]
-            )
-
-            assert result.exit_code == 0
-            assert "✓ Created story TESTP-1: Test Story" in result.output
-
-            # Verify story file was created
-            story_file = project_path / ".filter" / "stories" / "TESTP-1.md"
-            assert story_file.exists()
-
-            story_content = story_file.read_text(encoding="utf-8")
-            assert "# TESTP-1: Test Story" in story_content
-            assert "A test story" in story_content
-
-    def test_create_story_with_stage(self) -> None:
-        """Test story creation with custom stage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
 
-            result = self.runner.invoke(
-                story, ["create", "In Progress Story", "--stage", "in-progress", "--project-path", str(project_path)]
-            )
 
-            assert result.exit_code == 0
-            assert "✓ Created story TESTP-1: In Progress Story" in result.output
+# (stories to create as (title, stage), extra list args, expected output, absent output)
+_LIST_SCENARIOS = [
+    ([], [], ["No stories found."], []),
+    (
+        [("First Story", "planning"), ("Second Story", "in-progress")],
+        [],
+        ["Stories:", "TESTP-1: First Story [planning]", "TESTP-2: Second Story [in-progress]", "Total: 2 stories"],
+        [],
+    ),
+    (
+        [("Planning Story", "planning"), ("Progress Story", "in-progress")],
+        ["--stage", "planning"],
+        ["Stories (stage: planning):", "TESTP-1: Planning Story", "Total: 1 stories"],
+        ["TESTP-2"],
+    ),
+]
 
-            # Verify symlink in correct stage
-            kanban_link = project_path / ".filter" / "kanban" / "in-progress" / "TESTP-1.md"
-            assert kanban_link.exists()
-            assert kanban_link.is_symlink()
 
-    def test_create_story_no_project(self) -> None:
-        """Test story creation when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.runner.invoke(story, ["create", "Test Story", "--project-path", temp_dir])
+class _RaisingManager:
+    """Stand-in for StoryManager whose construction always fails."""
 
-            assert result.exit_code == 1
-            assert "✗" in result.output
-            assert "No filter project found" in result.output
+    def __init__(self, *args: object, **kwargs: object) -> None:
+        msg = "Unexpected error"
+        raise Exception(msg)
 
-    def test_create_story_invalid_stage(self) -> None:
-        """Test story creation with invalid stage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
 
-            result = self.runner.invoke(
-                story, ["create", "Test Story", "--stage", "invalid-stage", "--project-path", str(project_path)]
-            )
+def _create_test_project(root: Path) -> Path:
+    """Create a complete test project structure.
 
-            assert result.exit_code == 1
-            assert "✗" in result.output
-            assert "Invalid stage 'invalid-stage'" in result.output
+    Args:
+        root: Directory to create the project in
 
-    def test_create_story_default_project_path(self) -> None:
-        """Test story creation using default project path."""
-        # This test verifies that the --project-path option defaults to current directory
-        # Since we can't easily test changing directories in Click tests,
-        # we'll test the explicit path which is equivalent
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+    Returns:
+        Path to project directory
+    """
+    project_path = root / "test-project"
+    project_path.mkdir()
 
-            result = self.runner.invoke(story, ["create", "Default Path Story", "--project-path", str(project_path)])
+    # Create complete .filter structure
+    filter_dir = project_path / ".filter"
+    filter_dir.mkdir()
 
-            assert result.exit_code == 0
-            assert "✓ Created story TESTP-1: Default Path Story" in result.output
+    stories_dir = filter_dir / "stories"
+    stories_dir.mkdir()
 
-    def test_delete_story_success(self) -> None:
-        """Test successful story deletion via CLI."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+    kanban_dir = filter_dir / "kanban"
+    kanban_dir.mkdir()
 
-            # Create a story first
-            self.runner.invoke(story, ["create", "Test Story", "--project-path", str(project_path)])
+    # Create kanban stages
+    for stage in _KANBAN_STAGES:
+        (kanban_dir / stage).mkdir()
 
-            # Delete with force flag
-            result = self.runner.invoke(story, ["delete", "TESTP-1", "--force", "--project-path", str(project_path)])
+    # Create config.yml
+    (filter_dir / "config.yml").write_bytes(_CONFIG_BYTES)
 
-            assert result.exit_code == 0
-            assert "✓ Deleted story TESTP-1" in result.output
+    return project_path
 
-            # Verify story file was removed
-            story_file = project_path / ".filter" / "stories" / "TESTP-1.md"
-            assert not story_file.exists()
 
-    def test_delete_story_with_confirmation(self) -> None:
-        """Test story deletion with user confirmation."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+@pytest.fixture
+def project_path(tmp_path: Path) -> Path:
+    """Return a complete test project created under tmp_path."""
+    return _create_test_project(tmp_path)
 
-            # Create a story first
-            self.runner.invoke(story, ["create", "Test Story", "--project-path", str(project_path)])
 
-            # Delete with confirmation (simulate 'y' input)
-            result = self.runner.invoke(story, ["delete", "TESTP-1", "--project-path", str(project_path)], input="y\n")
+@pytest.fixture
+def with_story(project_path: Path) -> None:
+    """Add story TESTP-1, "Test Story", in planning to the test project."""
+    is_successful, _ = StoryManager(project_path).create_story("Test Story")
+    assert is_successful
 
-            assert result.exit_code == 0
-            assert "Are you sure you want to delete story TESTP-1?" in result.output
-            assert "✓ Deleted story TESTP-1" in result.output
 
-    def test_delete_story_cancelled(self) -> None:
-        """Test story deletion cancelled by user."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Create a story first
-            self.runner.invoke(story, ["create", "Test Story", "--project-path", str(project_path)])
-
-            # Delete with confirmation (simulate 'n' input)
-            result = self.runner.invoke(story, ["delete", "TESTP-1", "--project-path", str(project_path)], input="n\n")
-
-            assert result.exit_code == 0
-            assert "Deletion cancelled." in result.output
-
-            # Verify story file still exists
-            story_file = project_path / ".filter" / "stories" / "TESTP-1.md"
-            assert story_file.exists()
+class TestStoryCLI:
+    """Tests for story CLI commands."""
 
-    def test_delete_story_not_found(self) -> None:
-        """Test deleting non-existent story."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+    def test_create_story_success(self, project_path: Path) -> None:
+        """Test successful story creation via CLI."""
+        result = _RUNNER.invoke(
+            story, ["create", "Test Story", "--description", "A test story", "--project-path", str(project_path)]
+        )
 
-            result = self.runner.invoke(story, ["delete", "NONEX-1", "--force", "--project-path", str(project_path)])
+        assert result.exit_code == 0
+        assert f"{_OK}Created story TESTP-1: Test Story" in result.output
 
-            assert result.exit_code == 1
-            assert "✗" in result.output
-            assert "Story NONEX-1 not found" in result.output
+        # Verify story file was created
+        story_file = project_path / ".filter" / "stories" / "TESTP-1.md"
+        assert story_file.exists()
 
-    def test_delete_story_no_project(self) -> None:
-        """Test story deletion when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.runner.invoke(story, ["delete", "TEST-1", "--force", "--project-path", temp_dir])
+        story_content = story_file.read_text(encoding="utf-8")
+        assert "# TESTP-1: Test Story" in story_content
+        assert "A test story" in story_content
 
-            assert result.exit_code == 1
-            assert "✗" in result.output
-            assert "No filter project found" in result.output
+    def test_create_story_with_stage(self, project_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test story creation with custom stage."""
+        # Check the link the command asks for; test_move_story_success covers real symlinks
+        mock_symlink = Mock()
+        monkeypatch.setattr("filter.stories.os.symlink", mock_symlink)
+
+        result = _RUNNER.invoke(
+            story, ["create", "In Progress Story", "--stage", "in-progress", "--project-path", str(project_path)]
+        )
+
+        assert result.exit_code == 0
+        assert f"{_OK}Created story TESTP-1: In Progress Story" in result.output
+
+        # Verify symlink in correct stage
+        mock_symlink.assert_called_once_with(
+            "../../stories/TESTP-1.md", str(project_path / ".filter" / "kanban" / "in-progress" / "TESTP-1.md")
+        )
+
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            (["create", "Test Story"], f"{_FAIL}No filter project found"),
+            (["delete", "TEST-1", "--force"], f"{_FAIL}No filter project found"),
+            # move reports the missing project through a ClickException
+            (["move", "TEST-1", "in-progress"], "Error: Failed to move story: No filter project found"),
+        ],
+        ids=["create", "delete", "move"],
+    )
+    def test_no_project(self, tmp_path: Path, argv: list[str], expected: str) -> None:
+        """Test commands that need a project fail when no filter project exists."""
+        result = _RUNNER.invoke(story, [*argv, "--project-path", str(tmp_path)])
+
+        assert result.exit_code == 1
+        assert expected in result.output
+
+    def test_create_story_invalid_stage(self, project_path: Path) -> None:
+        """Test story creation with invalid stage."""
+        result = _RUNNER.invoke(
+            story, ["create", "Test Story", "--stage", "invalid-stage", "--project-path", str(project_path)]
+        )
 
-    def test_list_stories_empty(self) -> None:
-        """Test listing stories when none exist."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+        assert result.exit_code == 1
+        assert f"{_FAIL}Invalid stage 'invalid-stage'" in result.output
 
-            result = self.runner.invoke(story, ["list", "--project-path", str(project_path)])
+    def test_create_story_default_project_path(self, project_path: Path) -> None:
+        """Test story creation using default project path."""
+        # This test verifies that the --project-path option defaults to current directory
+        # Since we can't easily test changing directories in Click tests,
+        # we'll test the explicit path which is equivalent
+        result = _RUNNER.invoke(story, ["create", "Default Path Story", "--project-path", str(project_path)])
 
-            assert result.exit_code == 0
-            assert "No stories found." in result.output
+        assert result.exit_code == 0
+        assert f"{_OK}Created story TESTP-1: Default Path Story" in result.output
 
-    def test_list_stories_multiple(self) -> None:
-        """Test listing multiple stories."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+    @pytest.mark.usefixtures("with_story")
+    def test_delete_story_success(self, project_path: Path) -> None:
+        """Test successful story deletion via CLI."""
+        # Delete with force flag
+        result = _RUNNER.invoke(story, ["delete", "TESTP-1", "--force", "--project-path", str(project_path)])
 
-            # Create multiple stories
-            self.runner.invoke(story, ["create", "First Story", "--project-path", str(project_path)])
-            self.runner.invoke(
-                story, ["create", "Second Story", "--stage", "in-progress", "--project-path", str(project_path)]
-            )
+        assert result.exit_code == 0
+        assert f"{_OK}Deleted story TESTP-1" in result.output
 
-            result = self.runner.invoke(story, ["list", "--project-path", str(project_path)])
+        # Verify story file was removed
+        story_file = project_path / ".filter" / "stories" / "TESTP-1.md"
+        assert not story_file.exists()
 
-            assert result.exit_code == 0
-            assert "Stories:" in result.output
-            assert "TESTP-1: First Story [planning]" in result.output
-            assert "TESTP-2: Second Story [in-progress]" in result.output
-            assert "Total: 2 stories" in result.output
+    @pytest.mark.usefixtures("with_story")
+    def test_delete_story_with_confirmation(self, project_path: Path) -> None:
+        """Test story deletion with user confirmation."""
+        # Delete with confirmation (simulate 'y' input)
+        result = _RUNNER.invoke(story, ["delete", "TESTP-1", "--project-path", str(project_path)], input="y\n")
 
-    def test_list_stories_filtered_by_stage(self) -> None:
-        """Test listing stories filtered by stage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
+        assert result.exit_code == 0
+        assert "Are you sure you want to delete story TESTP-1?" in result.output
+        assert f"{_OK}Deleted story TESTP-1" in result.output
 
-            # Create stories in different stages
-            self.runner.invoke(story, ["create", "Planning Story", "--project-path", str(project_path)])
-            self.runner.invoke(
-                story, ["create", "Progress Story", "--stage", "in-progress", "--project-path", str(project_path)]
-            )
+    @pytest.mark.usefixtures("with_story")
+    def test_delete_story_cancelled(self, project_path: Path) -> None:
+        """Test story deletion cancelled by user."""
+        # Delete with confirmation (simulate 'n' input)
+        result = _RUNNER.invoke(story, ["delete", "TESTP-1", "--project-path", str(project_path)], input="n\n")
 
-            result = self.runner.invoke(story, ["list", "--stage", "planning", "--project-path", str(project_path)])
+        assert result.exit_code == 0
+        assert "Deletion cancelled." in result.output
 
-            assert result.exit_code == 0
-            assert "Stories (stage: planning):" in result.output
-            assert "TESTP-1: Planning Story" in result.output
-            assert "TESTP-2" not in result.output  # Should not show in-progress story
-            assert "Total: 1 stories" in result.output
+        # Verify story file still exists
+        story_file = project_path / ".filter" / "stories" / "TESTP-1.md"
+        assert story_file.exists()
 
-    def test_list_stories_no_project(self) -> None:
+    def test_delete_story_not_found(self, project_path: Path) -> None:
+        """Test deleting non-existent story."""
+        result = _RUNNER.invoke(story, ["delete", "NONEX-1", "--force", "--project-path", str(project_path)])
+
+        assert result.exit_code == 1
+        assert f"{_FAIL}Story NONEX-1 not found" in result.output
+
+    @pytest.mark.parametrize(
+        ("setup", "argv", "expected", "absent"),
+        _LIST_SCENARIOS,
+        ids=["empty", "multiple", "filtered-by-stage"],
+    )
+    def test_list_stories(
+        self,
+        project_path: Path,
+        setup: list[tuple[str, str]],
+        argv: list[str],
+        expected: list[str],
+        absent: list[str],
+    ) -> None:
+        """Test listing the stories seeded for each scenario."""
+        manager = StoryManager(project_path)
+        for title, stage in setup:
+            manager.create_story(title, stage=stage)
+
+        result = _RUNNER.invoke(story, ["list", *argv, "--project-path", str(project_path)])
+
+        assert result.exit_code == 0
+        for text in expected:
+            assert text in result.output
+        for text in absent:
+            assert text not in result.output
+
+    def test_list_stories_no_project(self, tmp_path: Path) -> None:
         """Test listing stories when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.runner.invoke(story, ["list", "--project-path", temp_dir])
+        result = _RUNNER.invoke(story, ["list", "--project-path", str(tmp_path)])
 
-            assert result.exit_code == 0
-            assert "No stories found." in result.output
+        assert result.exit_code == 0
+        assert "No stories found." in result.output
 
-    def test_move_story_success(self) -> None:
+    @pytest.mark.usefixtures("with_story")
+    def test_move_story_success(self, project_path: Path) -> None:
         """Test successful story move between stages."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Create a story first
-            self.runner.invoke(story, ["create", "Test Story", "--project-path", str(project_path)])
+        # Move story to in-progress
+        result = _RUNNER.invoke(story, ["move", "TESTP-1", "in-progress", "--project-path", str(project_path)])
 
-            # Move story to in-progress
-            result = self.runner.invoke(story, ["move", "TESTP-1", "in-progress", "--project-path", str(project_path)])
+        assert result.exit_code == 0
+        assert f"{_OK}Moved story TESTP-1 from planning to in-progress" in result.output
 
-            assert result.exit_code == 0
-            assert "✓ Moved story TESTP-1 from planning to in-progress" in result.output
+        # Verify symlinks
+        old_link = project_path / ".filter" / "kanban" / "planning" / "TESTP-1.md"
+        new_link = project_path / ".filter" / "kanban" / "in-progress" / "TESTP-1.md"
+        assert not old_link.exists()
+        assert new_link.exists()
+        assert new_link.is_symlink()
 
-            # Verify symlinks
-            old_link = project_path / ".filter" / "kanban" / "planning" / "TESTP-1.md"
-            new_link = project_path / ".filter" / "kanban" / "in-progress" / "TESTP-1.md"
-            assert not old_link.exists()
-            assert new_link.exists()
-            assert new_link.is_symlink()
-
-    def test_move_story_invalid_stage(self) -> None:
+    @pytest.mark.usefixtures("with_story")
+    def test_move_story_invalid_stage(self, project_path: Path) -> None:
         """Test moving story to invalid stage."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Create a story first
-            self.runner.invoke(story, ["create", "Test Story", "--project-path", str(project_path)])
+        result = _RUNNER.invoke(story, ["move", "TESTP-1", "invalid-stage", "--project-path", str(project_path)])
 
-            result = self.runner.invoke(
-                story, ["move", "TESTP-1", "invalid-stage", "--project-path", str(project_path)]
-            )
+        assert result.exit_code == 1
+        assert "Invalid stage 'invalid-stage'" in result.output
+        assert "Valid stages:" in result.output
 
-            assert result.exit_code == 1
-            assert "Invalid stage 'invalid-stage'" in result.output
-            assert "Valid stages:" in result.output
-
-    def test_move_story_not_found(self) -> None:
+    def test_move_story_not_found(self, project_path: Path) -> None:
         """Test moving non-existent story."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            result = self.runner.invoke(story, ["move", "NONEX-1", "in-progress", "--project-path", str(project_path)])
-
-            assert result.exit_code == 1
-            assert "Story NONEX-1 not found" in result.output
-
-    def test_move_story_no_project(self) -> None:
-        """Test moving story when no filter project exists."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            result = self.runner.invoke(story, ["move", "TEST-1", "in-progress", "--project-path", temp_dir])
-
-            assert result.exit_code == 1
-            assert "No filter project found" in result.output
-
-    def test_create_story_exception_handling(self) -> None:
-        """Test exception handling in create command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Mock StoryManager to raise exception
-            with patch("filter.story_cli.StoryManager") as mock_manager:
-                mock_manager.side_effect = Exception("Unexpected error")
-
-                result = self.runner.invoke(story, ["create", "Test Story", "--project-path", str(project_path)])
-
-                assert result.exit_code == 1
-                assert "Failed to create story: Unexpected error" in result.output
-
-    def test_delete_story_exception_handling(self) -> None:
-        """Test exception handling in delete command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Mock StoryManager to raise exception
-            with patch("filter.story_cli.StoryManager") as mock_manager:
-                mock_manager.side_effect = Exception("Unexpected error")
-
-                result = self.runner.invoke(story, ["delete", "TEST-1", "--force", "--project-path", str(project_path)])
-
-                assert result.exit_code == 1
-                assert "Failed to delete story: Unexpected error" in result.output
-
-    def test_list_stories_exception_handling(self) -> None:
-        """Test exception handling in list command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Mock StoryManager to raise exception
-            with patch("filter.story_cli.StoryManager") as mock_manager:
-                mock_manager.side_effect = Exception("Unexpected error")
-
-                result = self.runner.invoke(story, ["list", "--project-path", str(project_path)])
-
-                assert result.exit_code == 1
-                assert "Failed to list stories: Unexpected error" in result.output
-
-    def test_move_story_exception_handling(self) -> None:
-        """Test exception handling in move command."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            project_path = self.create_test_project(temp_dir)
-
-            # Mock StoryManager to raise exception
-            with patch("filter.story_cli.StoryManager") as mock_manager:
-                mock_manager.side_effect = Exception("Unexpected error")
-
-                result = self.runner.invoke(
-                    story, ["move", "TEST-1", "in-progress", "--project-path", str(project_path)]
-                )
-
-                assert result.exit_code == 1
-                assert "Failed to move story: Unexpected error" in result.output
+        result = _RUNNER.invoke(story, ["move", "NONEX-1", "in-progress", "--project-path", str(project_path)])
+
+        assert result.exit_code == 1
+        assert "Story NONEX-1 not found" in result.output
+
+    @pytest.mark.parametrize(
+        ("argv", "message"),
+        [
+            (["create", "Test Story"], "Failed to create story: Unexpected error"),
+            (["delete", "TEST-1", "--force"], "Failed to delete story: Unexpected error"),
+            (["list"], "Failed to list stories: Unexpected error"),
+            (["move", "TEST-1", "in-progress"], "Failed to move story: Unexpected error"),
+        ],
+        ids=["create", "delete", "list", "move"],
+    )
+    def test_exception_handling(
+        self, project_path: Path, monkeypatch: pytest.MonkeyPatch, argv: list[str], message: str
+    ) -> None:
+        """Test each command reports an unexpected StoryManager error and exits with 1."""
+        monkeypatch.setattr("filter.story_cli.StoryManager", _RaisingManager)
+
+        result = _RUNNER.invoke(story, [*argv, "--project-path", str(project_path)])
+
+        assert result.exit_code == 1
+        assert message in result.output
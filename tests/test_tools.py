@@ -1,23 +1,72 @@
 """Tests for the tools module."""
 
 import subprocess
-from unittest.mock import Mock, patch
+from collections.abc import Iterator
+from typing import Optional
+from unittest.mock import Mock
 
-from filter.tools import check_github_cli, gh_clone_repo
+import pytest
 
+from filter.tools import _gh_available, check_github_cli, gh_clone_repo
 
-class TestCheckGithubCli:
-    """Tests for check_github_cli function."""
+# Built once at import; each is raised by at most one mocked run per test
+_CMD_ERR = subprocess.CalledProcessError(returncode=1, cmd=["gh", "--version"], stderr="Command failed")
+_CLONE_ERR = subprocess.CalledProcessError(returncode=1, cmd=["gh", "repo", "clone"], stderr="Repository not found")
 
-    @patch("filter.tools.subprocess.run")
-    def test_github_cli_installed(self, mock_run: Mock) -> None:
-        """Test when GitHub CLI is installed and working."""
-        mock_run.return_value = Mock(stdout="gh version 2.32.1", returncode=0)
 
-        is_installed, message = check_github_cli()
+@pytest.fixture(autouse=True)
+def clear_gh_cache() -> Iterator[None]:
+    """Forget any cached gh availability check between tests."""
+    _gh_available.cache_clear()
+    yield
+    _gh_available.cache_clear()
+
 
-        assert is_installed is True
-        assert message == "GitHub CLI (gh) is installed: gh version 2.32.1"
+@pytest.fixture(autouse=True)
+def mock_run(monkeypatch: pytest.MonkeyPatch) -> Mock:
+    """Replace subprocess.run as seen by filter.tools, so no test can spawn a real gh."""
+    run = Mock()
+    # Only run is replaced: tools still needs the real CalledProcessError to catch
+    monkeypatch.setattr("filter.tools.subprocess.run", run)
+    return run
+
+
+class TestCheckGithubCli:
+    """Tests for check_github_cli function."""
+
+    @pytest.mark.parametrize(
+        ("return_value", "side_effect", "expected"),
+        [
+            (
+                Mock(stdout="gh version 2.32.1", returncode=0),
+                None,
+                (True, "GitHub CLI (gh) is installed: gh version 2.32.1"),
+            ),
+            (
+                None,
+                _CMD_ERR,
+                (False, "GitHub CLI command failed: Command failed"),
+            ),
+            (
+                None,
+                FileNotFoundError(),
+                (False, "GitHub CLI (gh) is not installed. Please install it from https://cli.github.com/"),
+            ),
+        ],
+        ids=["installed", "command-error", "not-found"],
+    )
+    def test_check_github_cli(
+        self,
+        mock_run: Mock,
+        return_value: Optional[Mock],
+        side_effect: Optional[Exception],
+        expected: tuple[bool, str],
+    ) -> None:
+        """Test the availability check when gh works, fails, or is not installed."""
+        mock_run.return_value = return_value
+        mock_run.side_effect = side_effect
+
+        assert check_github_cli() == expected
         mock_run.assert_called_once_with(
             ["gh", "--version"],
             check=True,
@@ -25,41 +74,50 @@ class TestCheckGithubCli:
             text=True,
         )
 
-    @patch("filter.tools.subprocess.run")
-    def test_github_cli_command_error(self, mock_run: Mock) -> None:
-        """Test when GitHub CLI command fails."""
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1, cmd=["gh", "--version"], stderr="Command failed"
-        )
-
-        is_installed, message = check_github_cli()
-
-        assert is_installed is False
-        assert message == "GitHub CLI command failed: Command failed"
-
-    @patch("filter.tools.subprocess.run")
-    def test_github_cli_not_found(self, mock_run: Mock) -> None:
-        """Test when GitHub CLI is not installed."""
-        mock_run.side_effect = FileNotFoundError()
-
-        is_installed, message = check_github_cli()
+    def test_github_cli_check_is_cached(self, mock_run: Mock) -> None:
+        """Test repeated checks only run gh once."""
+        mock_run.return_value = Mock(stdout="gh version 2.32.1", returncode=0)
 
-        assert is_installed is False
-        assert message == "GitHub CLI (gh) is not installed. Please install it from https://cli.github.com/"
+        assert check_github_cli() == check_github_cli()
+        mock_run.assert_called_once()
 
 
 class TestGhCloneRepo:
     """Tests for gh_clone_repo function."""
 
-    @patch("filter.tools.subprocess.run")
-    def test_successful_clone(self, mock_run: Mock) -> None:
-        """Test successful repository cloning."""
-        mock_run.return_value = Mock(stdout="Cloning into 'repo'...", returncode=0)
-
-        is_successful, message = gh_clone_repo("https://github.com/user/repo", "./test_dest")
-
-        assert is_successful is True
-        assert message == "Repository cloned successfully to ./test_dest"
+    @pytest.mark.parametrize(
+        ("return_value", "side_effect", "expected"),
+        [
+            (
+                Mock(stdout="Cloning into 'repo'...", returncode=0),
+                None,
+                (True, "Repository cloned successfully to ./test_dest"),
+            ),
+            (
+                None,
+                _CLONE_ERR,
+                (False, "Failed to clone repository: Repository not found"),
+            ),
+            (
+                None,
+                FileNotFoundError(),
+                (False, "GitHub CLI (gh) is not installed. Please install it from https://cli.github.com/"),
+            ),
+        ],
+        ids=["success", "command-error", "not-found"],
+    )
+    def test_gh_clone_repo(
+        self,
+        mock_run: Mock,
+        return_value: Optional[Mock],
+        side_effect: Optional[Exception],
+        expected: tuple[bool, str],
+    ) -> None:
+        """Test cloning when gh succeeds, fails, or is not installed."""
+        mock_run.return_value = return_value
+        mock_run.side_effect = side_effect
+
+        assert gh_clone_repo("https://github.com/user/repo", "./test_dest") == expected
         mock_run.assert_called_once_with(
             ["gh", "repo", "clone", "https://github.com/user/repo", "./test_dest"],
             check=True,
@@ -67,24 +125,14 @@ class TestGhCloneRepo:
             text=True,
         )
 
-    @patch("filter.tools.subprocess.run")
-    def test_clone_command_error(self, mock_run: Mock) -> None:
-        """Test when clone command fails."""
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1, cmd=["gh", "repo", "clone"], stderr="Repository not found"
-        )
-
-        is_successful, message = gh_clone_repo("https://github.com/user/nonexistent", "./test_dest")
-
-        assert is_successful is False
-        assert message == "Failed to clone repository: Repository not found"
-
-    @patch("filter.tools.subprocess.run")
-    def test_clone_github_cli_not_found(self, mock_run: Mock) -> None:
-        """Test when GitHub CLI is not installed during clone."""
+    def test_clone_skipped_after_failed_check(self, mock_run: Mock) -> None:
+        """Test clone reuses a failed availability check instead of spawning gh."""
         mock_run.side_effect = FileNotFoundError()
+        check_github_cli()
+        mock_run.reset_mock()
 
         is_successful, message = gh_clone_repo("https://github.com/user/repo", "./test_dest")
 
         assert is_successful is False
         assert message == "GitHub CLI (gh) is not installed. Please install it from https://cli.github.com/"
+        mock_run.assert_not_called()